@@ -0,0 +1,70 @@
+"""Mede o tempo de inicialização (cold start) e da primeira renderização de cada página.
+
+Cada medição roda em um processo Python novo, para que nenhuma biblioteca já esteja
+importada. Uso:
+
+    python benchmarks/inicializacao.py --repeticoes 3
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+PAGINAS = {
+    "Home": "paginas/home.py",
+    "Dados": "paginas/dados.py",
+    "Análise": "paginas/analise.py",
+    "Entendimentos": "paginas/entendimentos.py",
+}
+BIBLIOTECAS_PESADAS = ["matplotlib", "seaborn", "scipy", "streamlit_extras"]
+
+# Script executado no processo filho: importa o runner headless e abre a página direto
+_FILHO = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+if sys.argv[2] != "paginas/home.py":
+    at.switch_page(sys.argv[2])
+at.run()
+t2 = time.perf_counter()
+print(json.dumps({
+    "streamlit": t1 - t0,
+    "primeira_renderizacao": t2 - t1,
+    "excecoes": [str(e.value) for e in at.exception],
+    "pesadas": [m for m in %r if m in sys.modules],
+}))
+""" % (BIBLIOTECAS_PESADAS,)
+
+
+def medir(caminho_pagina):
+    resultado = subprocess.run(
+        [sys.executable, "-c", _FILHO, str(RAIZ / "Home.py"), caminho_pagina],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+    return json.loads(resultado.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'Página':<15}{'import st (s)':>15}{'1ª renderização (s)':>22}  bibliotecas pesadas")
+    for nome, caminho in PAGINAS.items():
+        medicoes = [medir(caminho) for _ in range(args.repeticoes)]
+        for m in medicoes:
+            if m["excecoes"]:
+                raise SystemExit(f"{nome}: {m['excecoes']}")
+        importacao = statistics.median(m["streamlit"] for m in medicoes)
+        renderizacao = statistics.median(m["primeira_renderizacao"] for m in medicoes)
+        pesadas = ", ".join(medicoes[-1]["pesadas"]) or "-"
+        print(f"{nome:<15}{importacao:>15.3f}{renderizacao:>22.3f}  {pesadas}")
+
+
+if __name__ == "__main__":
+    main()
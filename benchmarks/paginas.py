@@ -0,0 +1,196 @@
+"""Benchmark headless de todas as páginas e caminhos de widgets do app.
+
+Usa o `AppTest` do Streamlit para abrir cada página, percorrer todas as colunas do
+selectbox de "Dados", as duas caixas de comparação e uma varredura de intervalos de
+datas em "Análise", medindo tempo de parede, pico de memória (tracemalloc) e figuras
+renderizadas/abertas por seção. Cada escala roda num processo separado, com uma base
+sintética no esquema anual replicada 1x, 100x, 10.000x...
+
+    python benchmarks/paginas.py --escalas 1 100 10000
+
+O script termina com código 1 se alguma seção ultrapassar os limites de
+`benchmarks/limites.json`.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RAIZ = Path(__file__).resolve().parent.parent
+LIMITES = Path(__file__).resolve().parent / "limites.json"
+CATEGORIAS = ("BK", "BI", "BC", "CL")
+
+
+def gerar_dados_sinteticos(escala, semente=0):
+    """Base no esquema anual (Data, Valor_*, Var*, Part_*) com `escala` séries por ano."""
+    rng = np.random.default_rng(semente)
+    anos = np.arange(1997, 2026)
+    base = {"BK": 12_000, "BI": 110_000, "BC": 27_000, "CL": 20_000}
+    crescimento = {"BK": 300, "BI": 5_600, "BC": 850, "CL": 1_500}
+
+    data = np.repeat(anos, escala)
+    df = pd.DataFrame({"Data": data})
+    for cat in CATEGORIAS:
+        tendencia = base[cat] + crescimento[cat] * (data - anos.mean())
+        df[f"Valor_{cat}"] = np.abs(tendencia * rng.lognormal(0, 0.15, len(data)))
+    for cat in CATEGORIAS:
+        df[f"Var{cat}"] = rng.normal(0.04, 0.15, len(data))
+    total = df[[f"Valor_{cat}" for cat in CATEGORIAS]].sum(axis=1)
+    for cat in CATEGORIAS:
+        df[f"Part_{cat}"] = df[f"Valor_{cat}"] / total * 100
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+def _executar_escala(escala):
+    # Roda dentro do processo filho, com EXPORTACAO_ARQUIVO já apontando para a base sintética
+    from matplotlib import pyplot as plt
+    from streamlit.testing.v1 import AppTest
+
+    resultados = []
+    at = AppTest.from_file(str(RAIZ / "Home.py"), default_timeout=900)
+
+    def medir(pagina, secao, acao=None):
+        from utils.graficos import cache_figuras
+
+        if acao is not None:
+            acao()
+        renderizadas = cache_figuras.renderizacoes
+        tracemalloc.reset_peak()
+        inicio = time.perf_counter()
+        at.run()
+        tempo = time.perf_counter() - inicio
+        _, pico = tracemalloc.get_traced_memory()
+        if at.exception:
+            raise RuntimeError(f"{pagina} / {secao}: {[e.value for e in at.exception]}")
+        resultados.append({
+            "pagina": pagina,
+            "secao": secao,
+            "tempo_s": tempo,
+            "pico_mb": pico / 1e6,
+            "figuras_renderizadas": cache_figuras.renderizacoes - renderizadas,
+            "figuras_abertas": len(plt.get_fignums()),
+        })
+
+    tracemalloc.start()
+    medir("Home", "carregamento")
+
+    at.switch_page("paginas/dados.py")
+    medir("Dados", "abertura")
+    for coluna in at.selectbox[0].options:
+        medir("Dados", f"coluna={coluna}", lambda c=coluna: at.selectbox[0].set_value(c))
+
+    at.switch_page("paginas/analise.py")
+    medir("Análise", "abertura")
+    for coluna in at.selectbox(key="comp1").options:
+        medir("Análise", f"comp1={coluna}", lambda c=coluna: at.selectbox(key="comp1").set_value(c))
+    for coluna in at.selectbox(key="comp2").options:
+        medir("Análise", f"comp2={coluna}", lambda c=coluna: at.selectbox(key="comp2").set_value(c))
+    datas = list(at.select_slider[0].options)
+    meio = len(datas) // 2
+    intervalos = [
+        (datas[0], datas[-1]),
+        (datas[0], datas[meio]),
+        (datas[meio], datas[-1]),
+        (datas[max(0, len(datas) - 10)], datas[-1]),
+        (datas[meio], datas[meio]),
+    ]
+    for ini, fim in intervalos:
+        medir("Análise", f"intervalo={ini}-{fim}", lambda i=ini, f=fim: at.select_slider[0].set_range(i, f))
+
+    at.switch_page("paginas/entendimentos.py")
+    medir("Entendimentos", "abertura")
+    tracemalloc.stop()
+    return resultados
+
+
+def rodar_escala(escala):
+    with tempfile.TemporaryDirectory() as tmp:
+        arquivo = Path(tmp) / f"sintetico_{escala}x.parquet"
+        gerar_dados_sinteticos(escala).to_parquet(arquivo, index=False)
+        # Cache, armazém e métricas no diretório temporário: a base sintética não pode
+        # se misturar ao .cache real do projeto
+        ambiente = dict(
+            os.environ,
+            EXPORTACAO_ARQUIVO=str(arquivo),
+            EXPORTACAO_CACHE=str(Path(tmp) / "cache"),
+            EXPORTACAO_ARMAZEM=str(Path(tmp) / "exportacoes.sqlite"),
+            EXPORTACAO_METRICAS=str(Path(tmp) / "metricas.jsonl"),
+        )
+        saida = Path(tmp) / "resultado.json"
+        subprocess.run(
+            [sys.executable, __file__, "--executar-escala", str(escala), "--saida", str(saida)],
+            cwd=RAIZ, env=ambiente, check=True,
+        )
+        return json.loads(saida.read_text())
+
+
+def verificar_limites(escala, resultados, limites):
+    limite = limites.get(str(escala))
+    if limite is None:
+        return []
+    falhas = []
+    for r in resultados:
+        rotulo = f"{escala}x {r['pagina']} / {r['secao']}"
+        if r["tempo_s"] > limite["tempo_s"]:
+            falhas.append(f"{rotulo}: {r['tempo_s']:.2f} s > {limite['tempo_s']} s")
+        if r["pico_mb"] > limite["pico_mb"]:
+            falhas.append(f"{rotulo}: {r['pico_mb']:.1f} MB > {limite['pico_mb']} MB")
+        if r["figuras_abertas"] > limite["figuras_abertas"]:
+            falhas.append(f"{rotulo}: {r['figuras_abertas']} figuras abertas > {limite['figuras_abertas']}")
+    return falhas
+
+
+def resumir(escala, resultados):
+    df = pd.DataFrame(resultados)
+    resumo = df.groupby("pagina", sort=False).agg(
+        secoes=("secao", "count"),
+        tempo_medio_s=("tempo_s", "mean"),
+        tempo_max_s=("tempo_s", "max"),
+        pico_mb=("pico_mb", "max"),
+        figuras=("figuras_renderizadas", "sum"),
+        abertas=("figuras_abertas", "max"),
+    )
+    print(f"\n== Escala {escala}x ({29 * escala} linhas)")
+    print(resumo.round(3).to_string())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless das páginas do app.")
+    parser.add_argument("--escalas", type=int, nargs="+", default=[1, 100, 10_000])
+    parser.add_argument("--json", type=Path, help="grava todas as medições neste arquivo")
+    parser.add_argument("--executar-escala", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--saida", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.executar_escala is not None:
+        sys.path.insert(0, str(RAIZ))
+        args.saida.write_text(json.dumps(_executar_escala(args.executar_escala)))
+        return
+
+    limites = json.loads(LIMITES.read_text()) if LIMITES.exists() else {}
+    todas, falhas = {}, []
+    for escala in args.escalas:
+        resultados = rodar_escala(escala)
+        todas[escala] = resultados
+        resumir(escala, resultados)
+        falhas += verificar_limites(escala, resultados, limites)
+
+    if args.json:
+        args.json.write_text(json.dumps(todas, indent=2, ensure_ascii=False))
+    if falhas:
+        print("\nLimites ultrapassados:")
+        print("\n".join(f"  - {f}" for f in falhas))
+        sys.exit(1)
+    print("\nTodos os limites respeitados.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import scipy.stats as stats
+from utils.carregamento import carregar_armazem, carregar_dados, carregar_indice_datas, versao_dados
+from utils.exibicao import chave_grafico, exibir_grafico
+from utils.inferencia import bootstrap_diferenca, reamostras_por_orcamento, teste_permutacao
+from utils.instrumentacao import medir
+
+# Carregar os dados (planilha lida uma única vez e compartilhada entre as sessões)
+with medir("Análise", "carregamento"):
+    df = carregar_dados()
+    versao = versao_dados()
+    # Índice construído uma vez sobre a coluna 'Data' ordenada: filtros viram fatiamentos
+    indice_datas = carregar_indice_datas()
+
+st.title("Análise Estatística e Comparativa das Exportações")
+st.subheader("1. Comparação entre Colunas e Filtros por Ano")
+st.write("""
+Nesta seção, você pode comparar a evolução de duas categorias de exportação ao longo dos anos.  
+Utilize o filtro de anos para limitar a análise a um período específico e observe como os setores se comportam.
+""")
+
+# Comparação entre colunas: roda como fragmento, então mexer no intervalo de datas ou nas
+# colunas recalcula só esta seção (a comparação Brasil x EUA abaixo não é refeita)
+@st.fragment
+def secao_comparacao(df, indice_datas, versao):
+    # Filtro por intervalo de Data (mantendo valores reais da coluna "Data")
+    if "Data" in df.columns:
+        datas = indice_datas.datas.tolist()
+
+        if len(datas) < 2:
+            st.warning("A coluna 'Data' possui apenas um valor. O filtro de intervalo não será aplicado.")
+            data_inicio = data_fim = datas[0]
+            st.write(f"Exibindo dados da data: {data_inicio}")
+        else:
+            data_inicio, data_fim = st.select_slider(
+                "Selecione o intervalo de datas para análise:",
+                options=datas,
+                value=(datas[0], datas[-1])
+            )
+
+            if data_inicio == data_fim:
+                st.warning("Por favor, selecione duas datas diferentes para aplicar o filtro.")
+            else:
+                st.write(f"Exibindo dados do período: {data_inicio} até {data_fim}")
+
+        col_comp1, col_comp2 = st.columns(2)
+        # Ensure numeric_cols is defined before this block
+        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        if "Data" in numeric_cols:
+            numeric_cols.remove("Data")
+
+            with col_comp1:
+                col1_selecionada = st.selectbox("Selecione a 1ª coluna para comparação:", numeric_cols, key="comp1")
+            with col_comp2:
+                # Remover a coluna selecionada na primeira seleção para evitar comparação duplicada
+                cols_disp = [col for col in numeric_cols if col != col1_selecionada]
+                col2_selecionada = st.selectbox("Selecione a 2ª coluna para comparação:", cols_disp, key="comp2")
+
+            st.write("Comparando as duas colunas ao longo do tempo:")
+
+            # Gráfico de linha comparativo
+            with medir("Análise", "grafico_comparacao"):
+                # Médias por data vêm de um fatiamento do índice (barato, mesmo fora do cache)
+                df_group = indice_datas.medias_por_periodo(data_inicio, data_fim, [col1_selecionada, col2_selecionada])
+                exibir_grafico(
+                    chave_grafico("Análise", "comparacao", (col1_selecionada, col2_selecionada),
+                                  intervalo=(data_inicio, data_fim), versao=versao),
+                    lambda g: g.grafico_comparacao_temporal(df_group, col1_selecionada, col2_selecionada),
+                )
+
+            # Média de cada coluna no período, respondida pelas somas acumuladas do índice
+            medias_periodo = indice_datas.media_intervalo(data_inicio, data_fim, [col1_selecionada, col2_selecionada])
+            met1, met2 = st.columns(2)
+            met1.metric(f"Média de {col1_selecionada} no período", f"{medias_periodo[col1_selecionada]:,.2f}")
+            met2.metric(f"Média de {col2_selecionada} no período", f"{medias_periodo[col2_selecionada]:,.2f}")
+            st.write("""
+            No gráfico acima, as linhas mostram a evolução média dos valores exportados para as duas categorias ao longo do tempo.
+            Essa comparação permite identificar tendências relativas, possíveis correlações e impactos de eventos econômicos sobre o comércio.
+            """)
+
+
+secao_comparacao(df, indice_datas, versao)
+
+st.write("---")
+
+st.subheader("2. Comparação de Médias Bens de Capital : Brasil vs EUA")
+
+# Selecionar coluna de Bens de Capital
+coluna_valor = "Valor_BK"
+categoria = coluna_valor.removeprefix("Valor_")
+
+# Séries dos países vêm do armazém local: filtros e agregações rodam no SQL
+with medir("Análise", "armazem"):
+    armazem = carregar_armazem()
+    eua_disponivel = "EUA" in armazem.paises(categoria)
+    valores = armazem.valores("Brasil", categoria)
+    n_brasil = len(valores)
+    if eua_disponivel:
+        dados_eua = armazem.valores("EUA", categoria)
+        resumo = armazem.resumo_grupos(categoria, ["Brasil", "EUA"])
+        fonte_eua = armazem.assinatura()
+    else:
+        # Sem dados reais dos EUA no armazém: mantém a simulação usada até aqui
+        np.random.seed(42)
+        dados_eua = np.random.normal(loc=32981, scale=5000, size=n_brasil)  # desvio padrão suposto
+        resumo = pd.DataFrame({
+            "Grupo": ["Brasil", "EUA"],
+            "N": [n_brasil, n_brasil],
+            "Média": [valores.mean(), dados_eua.mean()],
+            "Desvio Padrão": [valores.std(ddof=1), dados_eua.std()],
+        })
+        fonte_eua = "simulado"
+
+media_brasil, media_eua = resumo["Média"]
+
+st.write(f"**Média das Exportações de Bens de Capital (Brasil):** {media_brasil:,.2f}")
+st.write(f"**Média das Exportações de Bens de Capital (EUA):** {media_eua:,.2f}")
+if not eua_disponivel:
+    st.info("Os valores dos EUA são simulados (média 32.981, desvio padrão 5.000). "
+            "Importe dados reais com `python -m utils.armazem importar <arquivo>` para substituí-los.")
+
+# Boxplot comparando as médias Brasil x EUA (com swarmplot para visualização dos pontos)
+df_box = pd.DataFrame({
+    "Valor": np.concatenate([valores, dados_eua]),
+    "Grupo": ["Brasil"] * len(valores) + ["EUA"] * len(dados_eua)
+})
+st.subheader("Boxplot Comparativo das Médias (Brasil x EUA)")
+with medir("Análise", "grafico_boxplot_swarm"):
+    exibir_grafico(
+        chave_grafico("Análise", "boxplot_swarm", ("Brasil", "EUA", coluna_valor), versao=(versao, fonte_eua)),
+        lambda g: g.grafico_boxplot_grupos(df_box),
+    )
+
+# Histograma comparativo
+st.subheader("Distribuição dos Valores (Brasil x EUA)")
+with medir("Análise", "grafico_histograma_grupos"):
+    exibir_grafico(
+        chave_grafico("Análise", "histograma_grupos", ("Brasil", "EUA", coluna_valor), versao=(versao, fonte_eua)),
+        lambda g: g.grafico_histograma_grupos(valores, dados_eua),
+    )
+
+# Tabela descritiva com média dos dois grupos
+st.subheader("Tabela de Médias dos Grupos")
+st.table(resumo[["Grupo", "Média"]])
+
+# Tabela de N e desvio padrão dos dois grupos
+st.subheader("Tabela de N e Desvio Padrão dos Grupos")
+st.table(resumo[["Grupo", "N", "Desvio Padrão"]])
+
+# Teste t, bootstrap e permutação dependem só da versão dos dados, da fonte dos EUA e da
+# categoria (as sementes são fixas): calculados uma vez e reaproveitados pelas sessões
+@st.cache_data(show_spinner=False, max_entries=8)
+def inferencia_brasil_eua(versao, fonte_eua, categoria, _valores, _dados_eua):
+    t_stat, p_valor = stats.ttest_ind(_valores, _dados_eua, alternative='greater', equal_var=False)
+    # Até 10.000 reamostras; em bases muito grandes o número cai para manter o custo limitado
+    n_reamostras = reamostras_por_orcamento(len(_valores) + len(_dados_eua))
+    intervalo = bootstrap_diferenca(_valores, _dados_eua, n_reamostras=n_reamostras, confianca=0.95, semente=42)
+    permutacao = teste_permutacao(_valores, _dados_eua, n_permutacoes=n_reamostras, alternativa="greater", semente=42)
+    return t_stat, p_valor, n_reamostras, intervalo, permutacao
+
+
+# Teste t de comparação de médias (unilateral, Brasil > EUA)
+with medir("Análise", "inferencia"):
+    t_stat_bk, p_valor_bk, n_reamostras, intervalo, permutacao = inferencia_brasil_eua(
+        versao, fonte_eua, categoria, valores, dados_eua)
+
+st.subheader("Teste T: Brasil vs EUA (Bens de Capital)")
+st.write("""
+**Hipóteses:**
+- H₀: Média Brasil ≤ Média EUA
+- H₁: Média Brasil > Média EUA
+""")
+
+st.write(f"**Estatística t:** {t_stat_bk:.4f}")
+st.write(f"**Valor-p (unilateral):** {p_valor_bk:.4f}")
+
+if p_valor_bk < 0.05:
+    st.success("Conclusão: Rejeitamos H₀. Há evidências de que a média de exportação brasileira de Bens de Capital é maior que a dos Estados Unidos.")
+else:
+    st.info("Conclusão: Falhamos em rejeitar H₀. Não há evidências suficientes para afirmar que a média brasileira de Bens de Capital seja maior que a dos EUA.")
+
+# Inferência por reamostragem: não depende da suposição de normalidade do teste t
+st.subheader("Bootstrap e Teste de Permutação: Brasil vs EUA")
+st.write(f"**Diferença de médias (Brasil − EUA):** {intervalo.estimativa:,.2f}")
+st.write(f"**Intervalo de confiança bootstrap de 95%:** [{intervalo.inferior:,.2f} ; {intervalo.superior:,.2f}]")
+st.write(f"**Valor-p do teste de permutação (unilateral):** {permutacao.p_valor:.4f}")
+st.write(f"""
+O bootstrap reamostra os dois grupos {n_reamostras:,} vezes para estimar a variabilidade da diferença de médias,
+e o teste de permutação embaralha os rótulos Brasil/EUA para ver com que frequência uma diferença
+tão grande surgiria apenas por acaso. Se o intervalo não contém o zero e o valor-p é menor que 0,05,
+os resultados reforçam a conclusão do teste t sem depender da suposição de normalidade.
+""")
@@ -0,0 +1,168 @@
+import streamlit as st
+import numpy as np
+from utils.carregamento import carregar_dados, carregar_estatisticas, carregar_ranking_crescimento, versao_dados
+from utils.exibicao import chave_grafico, exibir_grafico
+from utils.instrumentacao import medir
+from utils.tendencias import eixo_anos
+
+# Carregar os dados (planilha lida uma única vez e compartilhada entre as sessões)
+with medir("Dados", "carregamento"):
+    df = carregar_dados()
+    versao = versao_dados()
+
+st.title("Dados de Exportação Brasileira")
+
+# Estatísticas de todas as colunas numéricas, pré-calculadas no carregamento
+with medir("Dados", "estatisticas"):
+    estatisticas = carregar_estatisticas()
+
+# Seção dependente da coluna escolhida: roda como fragmento, então trocar a coluna
+# recalcula só esta parte (o boxplot estático e o ranking abaixo não são refeitos)
+@st.fragment
+def secao_coluna_selecionada(df, estatisticas, versao):
+    # Permitir ao usuário selecionar uma coluna para análise estatística
+    numeric_cols = estatisticas.index.tolist()
+    selected_column = st.selectbox("Selecione a coluna para análise estatística:", numeric_cols)
+
+    # Exibir os dados da coluna selecionada junto com a coluna 'Data', se existir
+    if "Data" in df.columns:
+        data_for_analysis = df[["Data", selected_column]].dropna()
+    else:
+        data_for_analysis = df[[selected_column]].dropna()
+
+    # Consultar estatísticas no índice pré-calculado
+    col1, col2, col3 = st.columns(3)
+    stats_coluna = estatisticas.loc[selected_column]
+    mean_val = stats_coluna["media"]
+    median_val = stats_coluna["mediana"]
+    mode_val = stats_coluna["moda"]
+
+    col1.metric("Média", f"{mean_val:,.2f}")
+    col2.metric("Mediana", f"{median_val:,.2f}")
+    col3.metric("Moda", f"{mode_val:,.2f}")
+
+    # Resumo interpretativo da coluna selecionada
+    st.subheader("Resumo da Coluna Selecionada")
+    resumo_colunas = {
+        "Valor_BK": ("Valores exportados de **Bens de Capital** – máquinas e equipamentos industriais. "
+                     "Refletem o investimento em infraestrutura e desenvolvimento tecnológico."),
+        "Valor_BI": ("Valores exportados de **Bens Intermediários** – insumos como aço, químicos e componentes. "
+                     "São essenciais para a cadeia produtiva e indicam integração industrial."),
+        "Valor_BC": ("Valores exportados de **Bens de Consumo** – produtos finais como roupas e eletrodomésticos. "
+                     "Indicadores de competitividade do Brasil no mercado consumidor."),
+        "Valor_CL": ("Valores exportados de **Combustíveis e Lubrificantes** – óleo bruto, derivados e similares. "
+                     "Ligados à extração de petróleo e à matriz energética do país."),
+        "VarBK": ("**Variação percentual anual dos Bens de Capital** exportados. "
+                  "Indica crescimento ou retração do setor em relação ao ano anterior."),
+        "VarBI": ("**Variação percentual anual dos Bens Intermediários**. "
+                  "Aponta dinâmica da cadeia de produção industrial e demanda global."),
+        "VarBC": ("**Variação percentual anual dos Bens de Consumo**. "
+                  "Reflete alterações na demanda externa por produtos finais brasileiros."),
+        "VarCL": ("**Variação percentual anual de Combustíveis e Lubrificantes** exportados. "
+                  "Fortemente influenciada por preços internacionais e produção interna."),
+        "Part_BK": ("**Participação percentual dos Bens de Capital** nas exportações totais do Brasil. "
+                    "Demonstra o peso desse setor na economia exportadora."),
+        "Part_BI": ("**Participação percentual dos Bens Intermediários** no total exportado. "
+                    "Mostra a relevância da indústria de base."),
+        "Part_BC": ("**Participação percentual dos Bens de Consumo**. "
+                    "Aponta para a importância de bens acabados no portfólio exportador."),
+        "Part_CL": ("**Participação percentual dos Combustíveis e Lubrificantes**. "
+                    "Fortemente atrelado ao setor energético e commodities globais.")
+    }
+
+    st.write(resumo_colunas.get(selected_column, 
+                                 "Esta coluna contém dados numéricos relevantes para a análise das exportações brasileiras."))
+
+    # GRÁFICO DE LINHA TEMPORAL
+    st.subheader("Variação ao Longo do Tempo")
+    with medir("Dados", "grafico_linha"):
+        exibir_grafico(
+            chave_grafico("Dados", "linha", selected_column, versao=versao),
+            lambda g: g.grafico_linha(data_for_analysis, selected_column),
+        )
+    st.write("Este gráfico de linha mostra como os valores dessa categoria de exportação variaram ao longo dos anos. "
+             "É útil para identificar tendências, ciclos ou quedas bruscas relacionadas a eventos econômicos ou políticas externas.")
+
+    # HISTOGRAMA
+    st.subheader("Distribuição dos Valores")
+    with medir("Dados", "grafico_histograma"):
+        exibir_grafico(
+            chave_grafico("Dados", "histograma", selected_column, versao=versao),
+            lambda g: g.grafico_histograma(data_for_analysis[selected_column], selected_column),
+        )
+    st.write("O histograma permite observar a frequência dos valores exportados. Picos indicam valores mais recorrentes. "
+             "A curva de densidade (KDE) ajuda a visualizar a forma geral da distribuição: simétrica, enviesada, etc.")
+
+
+    # ANÁLISE DE REGRESSÃO LINEAR SIMPLES
+    st.subheader("Análise de Regressão Linear Simples")
+
+    if "Data" in data_for_analysis.columns:
+        # Inclinação, intercepto e R² já vêm do índice; aqui só separamos os pontos do gráfico
+        x = eixo_anos(data_for_analysis)
+        y = data_for_analysis[selected_column].values
+        mask = ~np.isnan(x) & ~np.isnan(y)
+        x_clean = x[mask]
+        y_clean = y[mask]
+
+        if stats_coluna["n_regressao"] > 1 and not np.isnan(stats_coluna["coef"]):
+            coef = stats_coluna["coef"]
+            intercept = stats_coluna["intercepto"]
+            r2 = stats_coluna["r2"]
+
+            with medir("Dados", "grafico_regressao"):
+                exibir_grafico(
+                    chave_grafico("Dados", "regressao", selected_column, versao=versao),
+                    lambda g: g.grafico_regressao(x_clean, y_clean, coef, intercept, selected_column),
+                )
+
+            st.write(f"**Equação da reta:** {selected_column} = {coef:.2f} × Ano + {intercept:.2f}")
+            st.write(f"**R² (coeficiente de determinação):** {r2:.4f}")
+            if coef > 0:
+                st.success("A inclinação positiva indica tendência de crescimento ao longo do tempo.")
+            elif coef < 0:
+                st.info("A inclinação negativa indica tendência de queda ao longo do tempo.")
+            else:
+                st.info("A inclinação zero indica estabilidade ao longo do tempo.")
+        else:
+            st.warning("Não foi possível realizar a regressão linear devido à falta de dados numéricos adequados em 'Data'.")
+    else:
+        st.warning("A coluna 'Data' não está disponível para análise de regressão linear.")
+
+
+secao_coluna_selecionada(df, estatisticas, versao)
+
+# GRÁFICO ESTÁTICO COMPARANDO TODAS AS CATEGORIAS BK, BI, BC, CL
+st.subheader("Comparação Estática: BK, BI, BC, CL")
+
+categorias = ["Valor_BK", "Valor_BI", "Valor_BC", "Valor_CL"]
+categorias_existentes = [cat for cat in categorias if cat in df.columns]
+
+if categorias_existentes:
+    with medir("Dados", "grafico_boxplot"):
+        exibir_grafico(
+            chave_grafico("Dados", "boxplot", categorias_existentes, versao=versao),
+            lambda g: g.grafico_boxplot_categorias(df[categorias_existentes].dropna()),
+        )
+    st.write(
+        "O gráfico acima compara a distribuição dos valores exportados para cada categoria: "
+        "**BK** (Bens de Capital), **BI** (Bens Intermediários), **BC** (Bens de Consumo) e **CL** (Combustíveis e Lubrificantes). "
+        "Isso permite visualizar diferenças de escala, dispersão e possíveis outliers entre os grupos."
+    )
+else:
+    st.info("As colunas BK, BI, BC e CL não foram encontradas no dataset.")
+
+# RANKING DE CRESCIMENTO DE TODAS AS CATEGORIAS
+st.subheader("Quais produtos apresentam maior crescimento em exportações?")
+with medir("Dados", "ranking_crescimento"):
+    ranking = carregar_ranking_crescimento()
+if not ranking.empty:
+    st.dataframe(ranking.style.format(precision=2), use_container_width=True)
+    st.write(
+        "A tabela ajusta a tendência linear de todas as categorias de uma só vez. "
+        "O crescimento anual é a inclinação da reta dividida pela média da categoria, o que permite comparar setores "
+        "de tamanhos diferentes; a inclinação dos últimos anos mostra se o ritmo recente acelerou ou perdeu força. "
+        "Clique no nome de uma coluna para reordenar."
+    )
+else:
+    st.info("Nenhuma coluna de valores exportados (Valor_*) foi encontrada no dataset.")
@@ -0,0 +1,29 @@
+import streamlit as st
+
+st.write("---")
+st.subheader("Conclusões e Impactos no Contexto da Exportação Brasileira")
+
+st.image("img/ExpoBR.jpg",use_container_width=True)
+st.markdown("""
+**🗓️ Para entendimento:**
+- O ano de **2025 ainda está em andamento**, o que pode afetar medidas como média, mediana e interpretação de tendências.
+- Os anos de **2020 a 2022 foram impactados pela pandemia da COVID-19**, influenciando positivamente cadeias produtivas e fluxos comerciais.
+- Exemplos são: Aumento dos mercados digitais, Empresas de varejo na China, melhora tecnológica.
+- O ano de **2023 apresenta uma recuperação gradual**, mas os dados ainda podem ser afetados por incertezas econômicas e políticas.
+""")
+
+
+st.image("img/covid.jpg", width=300)
+st.markdown("""
+**📊 Interpretação Geral:**
+- Os **testes estatísticos** ajudam a entender se houve **mudanças significativas** nos padrões de exportação e se os dados estão distribuídos uniformemente.
+- A **comparação entre categorias de exportação**, filtradas por período, permite identificar **diferenças setoriais** ligadas a políticas públicas, flutuações da demanda internacional e eventos econômicos relevantes.
+""")
+
+st.image("img/BREXPO.png", width=300)
+st.markdown("""
+**💡 Sugestões de Interpretação:**
+- Resultados estatísticos significativos podem indicar **transformações nos investimentos** ou **na competitividade dos setores** exportadores.
+- Gráficos temporais ajudam a identificar impactos de **crises econômicas**, **variações cambiais** e **mudanças nas políticas de incentivo**.
+- Correlações entre setores podem revelar **relações de dependência ou complementaridade**, mostrando a **dinâmica do comércio exterior brasileiro**.
+""")
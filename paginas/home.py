@@ -0,0 +1,34 @@
+import streamlit as st
+from utils.carregamento import carregar_dados
+from utils.instrumentacao import medir
+
+# Carregar os dados (planilha lida uma única vez e compartilhada entre as sessões)
+with medir("Home", "carregamento"):
+    df = carregar_dados()
+
+st.title("Exportação Brasileira")
+st.image("img/porto-de-santos.jpg", use_container_width=True)
+st.write("""
+A exportação é um dos principais motores da economia brasileira, abrangendo diversos setores, 
+desde produtos agrícolas até manufaturados e bens de capital. Entender os dados da exportação 
+nos ajuda a compreender as tendências econômicas, os desafios e as oportunidades do Brasil no comércio global.
+""")
+
+st.subheader("Sobre os Dados")
+st.write("""
+O dataset utilizado contém informações detalhadas sobre a exportação brasileira. Algumas das colunas presentes incluem:
+- **Data**: O período da exportação registrado no dataset.
+- **Valor_BK, Valor_BI, Valor_BC, Valor_CL**: Representam os valores exportados em diferentes categorias de produtos.
+- **VarBK, VarBI, VarBC, VarCL**: Variáveis que mostram as variações percentuais nos valores exportados.
+- **Part_BK, Part_BI, Part_BC, Part_CL**: Representam a participação percentual de cada categoria no total exportado.
+""")
+
+st.subheader("Perguntas que os dados podem responder")
+st.write("""
+- Como os valores exportados variaram ao longo dos anos?
+- Quais produtos apresentam maior crescimento em exportações?
+- Existe uma sazonalidade nas exportações?
+- Como diferentes categorias de produtos contribuem para o total exportado?
+""")
+st.write("## Aqui estão os dados utilizados para análise:")
+st.dataframe(df)
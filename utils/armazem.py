@@ -0,0 +1,189 @@
+"""Armazém analítico local (SQLite) com séries de exportação de vários países.
+
+As páginas enviam filtros, agrupamentos e agregações para o SQL e trazem para o pandas
+apenas o resultado. Para importar outros países a partir de um arquivo em formato longo
+(colunas Pais, Data, Categoria, Valor):
+
+    python -m utils.armazem importar dados_eua.csv
+"""
+import argparse
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.ingestao import ler_blocos
+
+
+ARQUIVO_ARMAZEM = os.environ.get("EXPORTACAO_ARMAZEM", ".cache/exportacoes.sqlite")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS exportacoes (
+    pais TEXT NOT NULL,
+    data INTEGER NOT NULL,
+    categoria TEXT NOT NULL,
+    valor REAL,
+    origem TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_exportacoes_consulta ON exportacoes (categoria, pais, data);
+CREATE TABLE IF NOT EXISTS fontes (
+    origem TEXT PRIMARY KEY,
+    versao TEXT NOT NULL
+);
+"""
+
+
+class ArmazemExportacoes:
+    """Acesso ao banco SQLite; cada operação abre sua própria conexão (seguro entre sessões)."""
+
+    def __init__(self, caminho=ARQUIVO_ARMAZEM):
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_escrita = threading.Lock()
+        with closing(self._conectar()) as con, con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.executescript(_ESQUEMA)
+
+    def _conectar(self):
+        return sqlite3.connect(self.caminho)
+
+    def _consultar(self, sql, parametros=()):
+        with closing(self._conectar()) as con:
+            return pd.read_sql_query(sql, con, params=parametros)
+
+    # Escrita
+
+    def _substituir_origem(self, origem, versao, linhas, pais=None):
+        # Com `pais`, também remove as linhas desse país vindas de qualquer outra origem
+        with self._lock_escrita, closing(self._conectar()) as con, con:
+            con.execute("DELETE FROM exportacoes WHERE origem = ? OR pais = ?", (origem, pais))
+            # Fontes que ficaram sem nenhuma linha saem da assinatura
+            con.execute("DELETE FROM fontes WHERE origem NOT IN (SELECT DISTINCT origem FROM exportacoes)")
+            for bloco in linhas:
+                con.executemany(
+                    "INSERT INTO exportacoes (pais, data, categoria, valor, origem) VALUES (?, ?, ?, ?, ?)",
+                    bloco,
+                )
+            con.execute("INSERT OR REPLACE INTO fontes (origem, versao) VALUES (?, ?)", (origem, versao))
+
+    def copiar_para(self, caminho):
+        """Cópia consistente do banco (API de backup do SQLite), devolvida como outro armazém."""
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._conectar()) as origem, closing(sqlite3.connect(caminho)) as destino:
+            origem.backup(destino)
+        return ArmazemExportacoes(caminho)
+
+    def assinatura(self):
+        """Versões de todas as fontes importadas, usada como chave de cache dos gráficos."""
+        with closing(self._conectar()) as con:
+            return tuple(con.execute("SELECT origem, versao FROM fontes ORDER BY origem").fetchall())
+
+    def versao_origem(self, origem):
+        with closing(self._conectar()) as con:
+            linha = con.execute("SELECT versao FROM fontes WHERE origem = ?", (origem,)).fetchone()
+        return linha[0] if linha else None
+
+    def sincronizar_dataframe(self, df, pais, origem, versao):
+        """Grava as colunas Valor_* de um DataFrame no esquema anual como a série de `pais`.
+
+        O país sincronizado tem um único dono: trocar de arquivo (outra `origem`) substitui
+        todas as linhas do país em vez de somar as duas séries.
+        """
+        fonte = f"dataframe:{pais}"
+        versao = f"{origem}:{versao}"
+        if self.versao_origem(fonte) == versao:
+            return False
+        colunas = [c for c in df.columns if c.startswith("Valor_")]
+        longo = df.melt(id_vars="Data", value_vars=colunas, var_name="categoria", value_name="valor").dropna()
+        longo["categoria"] = longo["categoria"].str.removeprefix("Valor_")
+        linhas = zip([pais] * len(longo), longo["Data"].astype(int).tolist(), longo["categoria"].tolist(),
+                     longo["valor"].astype(float).tolist(), [fonte] * len(longo))
+        self._substituir_origem(fonte, versao, [linhas], pais=pais)
+        return True
+
+    def importar_arquivo(self, caminho, origem=None):
+        """Importa um arquivo longo (Pais, Data, Categoria, Valor) em blocos, sem carregá-lo inteiro."""
+        origem = origem or Path(caminho).name
+        versao = str(os.stat(caminho).st_mtime_ns)
+
+        def linhas():
+            for bloco in ler_blocos(caminho):
+                anos = bloco["Data"]
+                if not pd.api.types.is_numeric_dtype(anos):
+                    anos = pd.to_datetime(anos, errors="coerce").dt.year
+                bloco = bloco.assign(Data=anos).dropna(subset=["Data", "Valor"])
+                yield zip(bloco["Pais"].astype(str).tolist(), bloco["Data"].astype(int).tolist(),
+                          bloco["Categoria"].astype(str).tolist(), bloco["Valor"].astype(float).tolist(),
+                          [origem] * len(bloco))
+
+        self._substituir_origem(origem, versao, linhas())
+
+    # Consultas
+
+    def paises(self, categoria):
+        sql = "SELECT DISTINCT pais FROM exportacoes WHERE categoria = ? ORDER BY pais"
+        return self._consultar(sql, (categoria,))["pais"].tolist()
+
+    def _filtro(self, categoria, paises, inicio, fim):
+        condicoes = ["categoria = ?"]
+        parametros = [categoria]
+        if paises:
+            condicoes.append(f"pais IN ({', '.join('?' * len(paises))})")
+            parametros += list(paises)
+        if inicio is not None:
+            condicoes.append("data >= ?")
+            parametros.append(int(inicio))
+        if fim is not None:
+            condicoes.append("data <= ?")
+            parametros.append(int(fim))
+        return " AND ".join(condicoes), parametros
+
+    def valores(self, pais, categoria, inicio=None, fim=None):
+        """Valores de um país/categoria (opcionalmente num intervalo de anos), como array."""
+        onde, parametros = self._filtro(categoria, [pais], inicio, fim)
+        sql = f"SELECT valor FROM exportacoes WHERE {onde} ORDER BY data DESC"
+        return self._consultar(sql, parametros)["valor"].to_numpy(dtype=float)
+
+    def resumo_grupos(self, categoria, paises=None, inicio=None, fim=None):
+        """N, média e desvio padrão amostral por país, agregados no próprio SQL."""
+        onde, parametros = self._filtro(categoria, paises, inicio, fim)
+        # Duas passadas: a média por país primeiro e depois a soma dos desvios quadrados,
+        # que não sofre o cancelamento de Σx² − N·x̄² com valores grandes
+        sql = f"""
+            WITH filtrado AS (SELECT pais, valor FROM exportacoes WHERE {onde}),
+                 medias AS (SELECT pais, AVG(valor) AS media FROM filtrado GROUP BY pais)
+            SELECT f.pais AS Grupo, COUNT(f.valor) AS N, m.media AS media,
+                   SUM((f.valor - m.media) * (f.valor - m.media)) AS soma_desvios
+            FROM filtrado f JOIN medias m USING (pais) GROUP BY f.pais ORDER BY f.pais
+        """
+        resumo = self._consultar(sql, parametros)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variancia = resumo["soma_desvios"] / (resumo["N"] - 1)
+        resumo["Desvio Padrão"] = np.sqrt(variancia)
+        resumo = resumo.rename(columns={"media": "Média"}).drop(columns="soma_desvios")
+        if paises:
+            resumo = resumo.set_index("Grupo").reindex(list(paises)).reset_index()
+        return resumo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Armazém local de exportações por país.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    importar = sub.add_parser("importar", help="importa um arquivo longo (Pais, Data, Categoria, Valor)")
+    importar.add_argument("arquivo")
+    importar.add_argument("--origem", help="nome da fonte (padrão: nome do arquivo)")
+    args = parser.parse_args()
+
+    armazem = ArmazemExportacoes()
+    armazem.importar_arquivo(args.arquivo, origem=args.origem)
+    for categoria in ("BK", "BI", "BC", "CL"):
+        print(categoria, armazem.resumo_grupos(categoria).to_string(index=False), sep="\n")
+
+
+if __name__ == "__main__":
+    main()
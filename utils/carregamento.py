@@ -0,0 +1,155 @@
+import hashlib
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from utils.armazem import ArmazemExportacoes
+from utils.consultas import IndiceDatas
+from utils.estatisticas import colunas_numericas
+from utils.incremental import atualizar_estatisticas
+from utils.ingestao import agregar_anual, colunas_fonte, ler_tabela
+from utils.tendencias import ranking_crescimento
+
+
+# Arquivo de dados padrão (pode ser trocado pela variável EXPORTACAO_ARQUIVO) e
+# diretório onde ficam as cópias em Parquet e os agregados (EXPORTACAO_CACHE)
+ARQUIVO_DADOS = os.environ.get("EXPORTACAO_ARQUIVO", "Exportação_Brasileira_Anual.xlsx")
+DIRETORIO_CACHE = Path(os.environ.get("EXPORTACAO_CACHE", ".cache"))
+# Planilhas acima deste tamanho são lidas em streaming, com tipos reduzidos
+LIMITE_STREAMING = 50 * 1024 * 1024
+
+
+def versao_dados(file_path=ARQUIVO_DADOS):
+    """Assinatura barata do arquivo (caminho, mtime, tamanho) usada como chave de cache."""
+    info = os.stat(file_path)
+    return (str(file_path), info.st_mtime_ns, info.st_size)
+
+
+def _hash_arquivo(file_path):
+    # Hash do conteúdo em blocos, para não carregar o arquivo inteiro na memória
+    sha = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for bloco in iter(lambda: f.read(1 << 20), b""):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+
+def _caminho_sidecar(file_path, mtime_ns):
+    stem = Path(file_path).stem
+    return DIRETORIO_CACHE / f"{stem}-{_hash_arquivo(file_path)[:16]}-{mtime_ns}.parquet"
+
+
+def _remover_sidecars_antigos(file_path, atual):
+    # Só o padrão exato <stem>-<hash16>-<mtime>.parquet: "dados" não apaga as cópias de "dados-2024"
+    padrao = re.compile(re.escape(Path(file_path).stem) + r"-[0-9a-f]{16}-\d+\.parquet")
+    for antigo in DIRETORIO_CACHE.glob(f"{Path(file_path).stem}-*.parquet"):
+        if antigo != atual and padrao.fullmatch(antigo.name):
+            antigo.unlink(missing_ok=True)
+
+
+def _ler_fonte(file_path):
+    colunas = colunas_fonte(file_path)
+    if not any(str(c).startswith("Valor_") for c in colunas):
+        # Arquivo mensal/NCM em formato longo: agrega no esquema anual durante a leitura
+        return agregar_anual(file_path)
+    pequeno = os.path.getsize(file_path) < LIMITE_STREAMING
+    if Path(file_path).suffix.lower() in (".xlsx", ".xlsm") and pequeno:
+        return pd.read_excel(file_path)
+    return ler_tabela(file_path)
+
+
+def ler_dados(file_path=ARQUIVO_DADOS):
+    """Lê o arquivo de dados, reaproveitando a cópia Parquet quando ela ainda é válida.
+
+    A cópia é identificada pelo hash do conteúdo e pelo mtime do arquivo original,
+    então qualquer edição no arquivo gera uma nova leitura.
+    """
+    _, mtime_ns, _ = versao_dados(file_path)
+    sidecar = _caminho_sidecar(file_path, mtime_ns)
+    if sidecar.exists():
+        try:
+            return pd.read_parquet(sidecar)
+        except Exception:
+            # Cópia corrompida: descarta e volta a ler a planilha
+            sidecar.unlink(missing_ok=True)
+
+    df = _ler_fonte(file_path)
+    try:
+        DIRETORIO_CACHE.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(sidecar, index=False)
+        _remover_sidecars_antigos(file_path, sidecar)
+    except Exception:
+        # Sem pyarrow ou sem permissão de escrita: segue só com o cache em memória
+        pass
+    return df
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _carregar_dados_versao(file_path, mtime_ns, tamanho):
+    return ler_dados(file_path)
+
+
+def carregar_dados(file_path=ARQUIVO_DADOS):
+    """DataFrame somente leitura, compartilhado por todas as sessões do servidor.
+
+    A chave inclui mtime e tamanho do arquivo, então editar a planilha invalida o cache
+    automaticamente no próximo rerun. Como o objeto é o mesmo para todos os usuários,
+    as páginas não devem alterá-lo in place (filtros e seleções geram novos DataFrames).
+    """
+    return _carregar_dados_versao(*versao_dados(file_path))
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _carregar_estatisticas_versao(file_path, mtime_ns, tamanho):
+    df = _carregar_dados_versao(file_path, mtime_ns, tamanho)
+    estado = DIRETORIO_CACHE / f"{Path(file_path).stem}-estatisticas.pkl"
+    indice, _ = atualizar_estatisticas(df, estado)
+    return indice
+
+
+def carregar_estatisticas(file_path=ARQUIVO_DADOS):
+    """Índice de estatísticas de todas as colunas numéricas, calculado uma vez por versão do arquivo.
+
+    Os agregados ficam persistidos em .cache: quando a nova versão só acrescenta datas,
+    apenas as linhas novas são processadas (ver utils.incremental).
+    """
+    return _carregar_estatisticas_versao(*versao_dados(file_path))
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _carregar_indice_datas_versao(file_path, mtime_ns, tamanho):
+    df = _carregar_dados_versao(file_path, mtime_ns, tamanho)
+    return IndiceDatas(df, colunas_numericas(df))
+
+
+def carregar_indice_datas(file_path=ARQUIVO_DADOS):
+    """Índice por data (busca binária + somas acumuladas) usado nos filtros de intervalo."""
+    return _carregar_indice_datas_versao(*versao_dados(file_path))
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _carregar_ranking_crescimento_versao(file_path, mtime_ns, tamanho, janela):
+    df = _carregar_dados_versao(file_path, mtime_ns, tamanho)
+    categorias = [c for c in colunas_numericas(df) if c.startswith("Valor_")]
+    return ranking_crescimento(df, categorias, janela=janela)
+
+
+def carregar_ranking_crescimento(file_path=ARQUIVO_DADOS, janela=10):
+    """Tendência de todas as categorias Valor_* ajustada de uma vez, ordenada por crescimento."""
+    return _carregar_ranking_crescimento_versao(*versao_dados(file_path), janela)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _carregar_armazem_versao(file_path, mtime_ns, tamanho):
+    armazem = ArmazemExportacoes()
+    df = _carregar_dados_versao(file_path, mtime_ns, tamanho)
+    armazem.sincronizar_dataframe(df, pais="Brasil", origem=Path(file_path).name, versao=f"{mtime_ns}-{tamanho}")
+    return armazem
+
+
+def carregar_armazem(file_path=ARQUIVO_DADOS):
+    """Armazém SQLite com os dados do Brasil já sincronizados com a versão atual do arquivo."""
+    return _carregar_armazem_versao(*versao_dados(file_path))
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+
+class IndiceDatas:
+    """Índice sobre a coluna 'Data' ordenada, construído uma única vez por versão dos dados.
+
+    Guarda as linhas ordenadas por data, a média de cada coluna por data (o equivalente a
+    `groupby("Data").mean()`) e somas/contagens acumuladas. Assim, filtrar um intervalo é
+    uma busca binária seguida de um fatiamento, e a média do intervalo sai da diferença
+    entre duas somas acumuladas, sem percorrer o DataFrame de novo.
+    """
+
+    def __init__(self, df, colunas):
+        self.colunas = list(colunas)
+        ordenado = df[df["Data"].notna()].sort_values("Data", kind="stable").reset_index(drop=True)
+        self.df = ordenado
+
+        datas_linhas = ordenado["Data"].to_numpy()
+        self.datas, inicio_grupos = np.unique(datas_linhas, return_index=True)
+        self._datas_linhas = datas_linhas
+
+        Y = ordenado[self.colunas].to_numpy(dtype=float)
+        validos = ~np.isnan(Y)
+        if len(self.datas):
+            somas = np.add.reduceat(np.where(validos, Y, 0.0), inicio_grupos, axis=0)
+            contagens = np.add.reduceat(validos.astype(np.int64), inicio_grupos, axis=0)
+        else:
+            somas = np.zeros((0, len(self.colunas)))
+            contagens = np.zeros((0, len(self.colunas)), dtype=np.int64)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            medias = somas / contagens
+        self.medias = pd.DataFrame(medias, columns=self.colunas)
+        self.medias.insert(0, "Data", self.datas)
+
+        # Linha extra de zeros para que a soma do intervalo [i, j) seja acum[j] - acum[i]
+        self._somas_acum = np.vstack([np.zeros(len(self.colunas)), np.cumsum(somas, axis=0)])
+        self._contagens_acum = np.vstack([np.zeros(len(self.colunas), dtype=np.int64),
+                                          np.cumsum(contagens, axis=0)])
+
+    def _posicoes(self, inicio, fim, valores):
+        return np.searchsorted(valores, inicio, side="left"), np.searchsorted(valores, fim, side="right")
+
+    def filtrar(self, inicio, fim):
+        """Linhas com inicio <= Data <= fim, como fatia do DataFrame ordenado."""
+        i, j = self._posicoes(inicio, fim, self._datas_linhas)
+        return self.df.iloc[i:j]
+
+    def medias_por_periodo(self, inicio, fim, colunas=None):
+        """Médias por data dentro do intervalo (mesmo resultado de `groupby("Data").mean()`)."""
+        i, j = self._posicoes(inicio, fim, self.datas)
+        colunas = self.colunas if colunas is None else list(colunas)
+        return self.medias.iloc[i:j][["Data"] + colunas].reset_index(drop=True)
+
+    def media_intervalo(self, inicio, fim, colunas=None):
+        """Média de cada coluna sobre todas as linhas do intervalo, via somas acumuladas."""
+        i, j = self._posicoes(inicio, fim, self.datas)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            medias = (self._somas_acum[j] - self._somas_acum[i]) / (self._contagens_acum[j] - self._contagens_acum[i])
+        serie = pd.Series(medias, index=self.colunas)
+        return serie if colunas is None else serie[list(colunas)]
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from utils.tendencias import ajustar_tendencias, eixo_anos
+
+
+def colunas_numericas(df):
+    # Colunas numéricas analisáveis (a coluna 'Data' é usada como eixo, não como variável)
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    if "Data" in numeric_cols:
+        numeric_cols.remove("Data")
+    return numeric_cols
+
+
+def indice_estatisticas(df):
+    """Calcula, numa única passada vetorizada, as estatísticas de todas as colunas numéricas.
+
+    Retorna um DataFrame indexado pelo nome da coluna com N, média, mediana, moda e a
+    regressão linear simples contra o ano (inclinação, intercepto e R²).
+    """
+    colunas = colunas_numericas(df)
+    Y = df[colunas].to_numpy(dtype=float)
+    validos = ~np.isnan(Y)
+    n = validos.sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        media = np.where(n > 0, np.where(validos, Y, 0.0).sum(axis=0) / n, np.nan)
+    mediana = np.nanmedian(Y, axis=0) if len(Y) else np.full(len(colunas), np.nan)
+    # mode() do pandas devolve as modas em ordem crescente; a primeira linha é a menor
+    modas = df[colunas].mode()
+    moda = modas.iloc[0].to_numpy(dtype=float) if not modas.empty else np.full(len(colunas), np.nan)
+
+    coef = np.full(len(colunas), np.nan)
+    intercepto = np.full(len(colunas), np.nan)
+    r2 = np.full(len(colunas), np.nan)
+    n_reg = np.zeros(len(colunas), dtype=int)
+    x = eixo_anos(df)
+    if x is not None and len(x) > 1:
+        n_reg, coef, intercepto, r2 = ajustar_tendencias(x, Y)
+
+    return pd.DataFrame(
+        {
+            "n": n,
+            "media": media,
+            "mediana": mediana,
+            "moda": moda,
+            "n_regressao": n_reg,
+            "coef": coef,
+            "intercepto": intercepto,
+            "r2": r2,
+        },
+        index=pd.Index(colunas, name="coluna"),
+    )
@@ -0,0 +1,50 @@
+"""Escolha do backend dos gráficos e exibição na página.
+
+Módulo leve, importado pelo Home.py: plotly e matplotlib/seaborn só são importados quando
+um gráfico do backend correspondente é de fato desenhado.
+"""
+import os
+
+import streamlit as st
+
+
+CONFIG_PLOTLY = {"displaylogo": False, "scrollZoom": True}
+
+
+def chave_grafico(pagina, tipo, colunas=(), intervalo=None, versao=None):
+    """Chave do cache: (página, tipo de gráfico, coluna(s), intervalo de datas, versão dos dados)."""
+    if isinstance(colunas, str):
+        colunas = (colunas,)
+    return (pagina, tipo, tuple(colunas), intervalo, versao)
+
+
+def graficos_interativos_ativos():
+    """Backend escolhido na barra lateral (ou Plotly por padrão com EXPORTACAO_GRAFICOS=plotly)."""
+    padrao = os.environ.get("EXPORTACAO_GRAFICOS") == "plotly"
+    return st.session_state.get("graficos_interativos", padrao)
+
+
+def seletor_graficos():
+    st.sidebar.toggle(
+        "Gráficos interativos (Plotly) 🔍",
+        key="graficos_interativos",
+        value=graficos_interativos_ativos(),
+        help="Zoom, seleção de intervalo e séries na legenda direto no navegador.",
+    )
+
+
+def exibir_grafico(chave, desenhar):
+    """Mostra o gráfico no backend escolhido: PNG do matplotlib ou Plotly no navegador.
+
+    `desenhar` recebe o módulo do backend ativo (utils.graficos ou utils.graficos_interativos,
+    que têm as mesmas funções) e monta a figura; o resultado fica no cache desse backend.
+    """
+    if graficos_interativos_ativos():
+        from utils import graficos_interativos
+
+        fig = graficos_interativos.cache_interativas.obter(chave, lambda: desenhar(graficos_interativos))
+        st.plotly_chart(fig, config=CONFIG_PLOTLY)
+    else:
+        from utils import graficos
+
+        st.image(graficos.renderizar_figura(chave, lambda: desenhar(graficos)), use_container_width=True)
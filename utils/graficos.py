@@ -0,0 +1,205 @@
+import io
+import threading
+from collections import OrderedDict
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from matplotlib.figure import Figure
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+from utils.reducao import amostrar, estatisticas_boxplot, histograma_binado, kde_binada, reduzir_serie
+
+
+# Orçamento do cache de figuras renderizadas (bytes de PNG/SVG em memória)
+LIMITE_BYTES_FIGURAS = 64 * 1024 * 1024
+MAX_FIGURAS = 256
+
+
+class CacheFiguras:
+    """Cache LRU de figuras já rasterizadas, limitado por número de itens e por bytes.
+
+    A figura do matplotlib só existe durante a renderização: é salva em bytes e descartada
+    logo em seguida. Como é criada fora do pyplot (ver _figura), nada fica no registro global,
+    nem quando o desenho falha no meio.
+    """
+
+    def __init__(self, limite_bytes=LIMITE_BYTES_FIGURAS, max_itens=MAX_FIGURAS):
+        self.limite_bytes = limite_bytes
+        self.max_itens = max_itens
+        self.total_bytes = 0
+        self.acertos = 0
+        self.renderizacoes = 0
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._itens)
+
+    def renderizar(self, chave, desenhar, formato="png", dpi=200):
+        chave = (chave, formato, dpi)
+        with self._lock:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return self._itens[chave]
+
+        buffer = io.BytesIO()
+        desenhar().savefig(buffer, format=formato, bbox_inches="tight", dpi=dpi)
+        conteudo = buffer.getvalue()
+
+        with self._lock:
+            self.renderizacoes += 1
+            if chave not in self._itens:
+                self._itens[chave] = conteudo
+                self.total_bytes += len(conteudo)
+            self._itens.move_to_end(chave)
+            self._despejar()
+        return conteudo
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+            self.total_bytes = 0
+
+    def _despejar(self):
+        # Remove as figuras menos usadas recentemente até caber no orçamento
+        while self._itens and (len(self._itens) > self.max_itens or self.total_bytes > self.limite_bytes):
+            _, conteudo = self._itens.popitem(last=False)
+            self.total_bytes -= len(conteudo)
+
+
+# Instância única por processo, compartilhada por todas as sessões
+cache_figuras = CacheFiguras()
+
+
+def renderizar_figura(chave, desenhar, formato="png"):
+    """Devolve os bytes da figura, desenhando-a apenas se ainda não estiver no cache."""
+    return cache_figuras.renderizar(chave, desenhar, formato=formato)
+
+
+def _figura(figsize):
+    # Figure direto, sem pyplot: não há estado global compartilhado entre as threads do servidor
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots()
+
+
+# Todos os gráficos passam pelas reduções de utils.reducao antes de desenhar, então o
+# custo depende da largura do gráfico e não da quantidade de linhas do dataset
+
+def _linha_reduzida(ax, x, y, rotulo=None):
+    x_red, y_red, banda = reduzir_serie(x, y)
+    linha = sns.lineplot(x=x_red, y=y_red, marker="o", label=rotulo, ax=ax).lines[-1]
+    if banda is not None:
+        ax.fill_between(x_red, y_red - banda, y_red + banda, color=linha.get_color(), alpha=0.2, linewidth=0)
+
+
+def _histograma_reduzido(ax, valores, bins=20, densidade=False, **kwargs):
+    contagens, bordas = histograma_binado(valores, bins=bins)
+    centros = (bordas[:-1] + bordas[1:]) / 2
+    stat = "density" if densidade else "count"
+    binado = pd.DataFrame({"centro": centros, "contagem": contagens})
+    sns.histplot(data=binado, x="centro", weights="contagem", bins=bordas.tolist(), stat=stat, ax=ax, **kwargs)
+    grade, kde = kde_binada(valores, corte=0)
+    if len(grade):
+        # Mesma escala do histograma: densidade pura ou densidade × N × largura do bin
+        escala = 1.0 if densidade else contagens.sum() * (bordas[1] - bordas[0])
+        ax.plot(grade, kde * escala, color=kwargs.get("color", ax.patches[-1].get_facecolor()[:3]))
+
+
+def _boxplot_quantis(ax, grupos, paleta, mostrar_media=False):
+    estatisticas = [estatisticas_boxplot(valores, rotulo) for rotulo, valores in grupos]
+    if not estatisticas:
+        return estatisticas
+    caixas = ax.bxp(
+        estatisticas, widths=0.8, patch_artist=True, showmeans=mostrar_media,
+        meanprops={"marker": "o", "markerfacecolor": "black", "markeredgecolor": "black"},
+        medianprops={"color": "0.25"}, flierprops={"marker": "d", "markerfacecolor": "0.25", "markersize": 4},
+    )
+    for caixa, cor in zip(caixas["boxes"], sns.color_palette(paleta, len(estatisticas), desat=0.75)):
+        caixa.set_facecolor(cor)
+    return estatisticas
+
+
+# Gráficos da página "Dados"
+
+def grafico_linha(data_for_analysis, coluna):
+    fig, ax = _figura((10, 4))
+    _linha_reduzida(ax, data_for_analysis["Data"], data_for_analysis[coluna])
+    ax.set_title(f"{coluna} ao longo do tempo")
+    ax.set_ylabel("Valor")
+    ax.set_xlabel("Ano")
+    return fig
+
+
+def grafico_histograma(valores, coluna):
+    fig, ax = _figura((8, 4))
+    _histograma_reduzido(ax, valores, bins=20)
+    ax.set_title(f"Distribuição de {coluna}")
+    ax.set_xlabel(coluna)
+    return fig
+
+
+def grafico_regressao(x, y, coef, intercepto, coluna):
+    fig, ax = _figura((8, 4))
+    indices = amostrar(np.arange(len(x)))
+    ax.scatter(x[indices], y[indices], color="blue", label="Dados reais")
+    extremos = np.array([np.min(x), np.max(x)])
+    ax.plot(extremos, coef * extremos + intercepto, color="red", label="Regressão Linear")
+    ax.set_title(f"Regressão Linear: {coluna} vs Ano")
+    ax.set_xlabel("Ano")
+    ax.set_ylabel(coluna)
+    ax.legend()
+    return fig
+
+
+def grafico_boxplot_categorias(dados_plot):
+    fig, ax = _figura((10, 5))
+    _boxplot_quantis(ax, [(coluna, dados_plot[coluna].to_numpy()) for coluna in dados_plot.columns], None)
+    ax.set_title("Distribuição dos Valores Exportados: BK, BI, BC, CL")
+    ax.set_ylabel("Valor Exportado")
+    ax.set_xlabel("Categoria")
+    return fig
+
+
+# Gráficos da página "Análise"
+
+def grafico_comparacao_temporal(df_group, coluna1, coluna2):
+    fig, ax = _figura((10, 5))
+    _linha_reduzida(ax, df_group["Data"], df_group[coluna1], rotulo=coluna1)
+    _linha_reduzida(ax, df_group["Data"], df_group[coluna2], rotulo=coluna2)
+    ax.set_title(f"Comparação Temporal: {coluna1} vs {coluna2}")
+    ax.set_xlabel("Data")
+    ax.set_ylabel("Valor Médio")
+    return fig
+
+
+def grafico_boxplot_grupos(df_box):
+    fig, ax = _figura((7, 5))
+    grupos = [(grupo, dados["Valor"].to_numpy()) for grupo, dados in df_box.groupby("Grupo", sort=False)]
+    _boxplot_quantis(ax, grupos, "Set2", mostrar_media=True)
+    # Swarmplot sobre uma amostra limitada por grupo: o layout do swarm é quadrático em N
+    amostra = pd.DataFrame([
+        {"Grupo": grupo, "Valor": valor, "Posicao": posicao + 1}
+        for posicao, (grupo, valores) in enumerate(grupos)
+        for valor in amostrar(valores, semente=posicao)
+    ], columns=["Grupo", "Valor", "Posicao"])
+    sns.swarmplot(x="Posicao", y="Valor", data=amostra, ax=ax, color=".25", size=3, native_scale=True)
+    ax.set_xticks(range(1, len(grupos) + 1), [grupo for grupo, _ in grupos])
+    ax.set_xlabel("Grupo")
+    ax.set_title("Comparação das Médias de Exportação de Bens de Capital")
+    ax.set_ylabel("Valor Exportado")
+    return fig
+
+
+def grafico_histograma_grupos(valores_brasil, valores_eua):
+    fig, ax = _figura((8, 4))
+    _histograma_reduzido(ax, valores_brasil, bins=20, densidade=True, color="royalblue", label="Brasil")
+    _histograma_reduzido(ax, valores_eua, bins=20, densidade=True, color="orange", label="EUA")
+    ax.legend()
+    ax.set_title("Distribuição das Exportações de Bens de Capital")
+    ax.set_xlabel("Valor Exportado")
+    return fig
@@ -0,0 +1,193 @@
+"""Backend interativo (Plotly/WebGL) para os gráficos de série temporal, comparação e distribuição.
+
+Os dados passam pelas mesmas reduções de utils.reducao e vão ao navegador uma única vez como
+arrays tipados (float32 em base64). Zoom, seleção de intervalo e ocultar séries pela legenda
+acontecem no cliente, sem rerun nem nova rasterização no servidor.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import plotly.graph_objects as go
+
+from utils.reducao import (
+    LIMITE_PONTOS,
+    amostrar,
+    estatisticas_boxplot,
+    histograma_binado,
+    kde_binada,
+    reduzir_serie,
+)
+
+
+# Figuras Plotly mantidas em memória (as reduzidas têm poucos KB cada)
+MAX_FIGURAS = 256
+CORES = ["#4c72b0", "#dd8452", "#55a868", "#c44e52", "#8172b3", "#937860"]
+
+
+class CacheFigurasInterativas:
+    """Cache LRU das figuras Plotly já montadas, compartilhado por todas as sessões."""
+
+    def __init__(self, max_itens=MAX_FIGURAS):
+        self.max_itens = max_itens
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._itens)
+
+    def obter(self, chave, montar):
+        with self._lock:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                return self._itens[chave]
+        fig = montar()
+        with self._lock:
+            self._itens[chave] = fig
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+        return fig
+
+
+cache_interativas = CacheFigurasInterativas()
+
+
+def _f32(valores):
+    # float32 basta para exibição e reduz o payload pela metade
+    return np.asarray(valores, dtype=np.float32)
+
+
+def _layout(fig, titulo, eixo_x, eixo_y, serie_temporal=False):
+    fig.update_layout(
+        title=titulo,
+        xaxis_title=eixo_x,
+        yaxis_title=eixo_y,
+        template="none",
+        margin=dict(l=60, r=20, t=60, b=40),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0),
+        hovermode="x unified" if serie_temporal else "closest",
+    )
+    if serie_temporal:
+        # Barra de intervalo abaixo do eixo: seleção do período feita no navegador
+        fig.update_xaxes(rangeslider=dict(visible=True, thickness=0.08))
+    return fig
+
+
+def _linha_reduzida(fig, x, y, rotulo, cor):
+    x_red, y_red, banda = reduzir_serie(x, y)
+    if banda is not None:
+        # Banda do IC de 95% no mesmo grupo da legenda: ocultar a série oculta a banda
+        fig.add_trace(go.Scattergl(
+            x=_f32(np.concatenate([x_red, x_red[::-1]])),
+            y=_f32(np.concatenate([y_red + banda, (y_red - banda)[::-1]])),
+            fill="toself", fillcolor=cor, opacity=0.2, line=dict(width=0),
+            hoverinfo="skip", showlegend=False, legendgroup=rotulo,
+        ))
+    fig.add_trace(go.Scattergl(
+        x=_f32(x_red), y=_f32(y_red), mode="lines+markers", name=rotulo,
+        line=dict(color=cor), marker=dict(size=5), legendgroup=rotulo,
+    ))
+
+
+def _histograma_reduzido(fig, valores, rotulo, cor, bins=20, densidade=False):
+    contagens, bordas = histograma_binado(valores, bins=bins)
+    largura = bordas[1] - bordas[0]
+    total = contagens.sum()
+    alturas = contagens / (total * largura) if densidade and total else contagens
+    fig.add_trace(go.Bar(
+        x=_f32((bordas[:-1] + bordas[1:]) / 2), y=_f32(alturas), width=largura,
+        name=rotulo, marker=dict(color=cor, line=dict(width=0.5, color="white")),
+        opacity=0.6, legendgroup=rotulo,
+    ))
+    grade, kde = kde_binada(valores, corte=0)
+    if len(grade):
+        escala = 1.0 if densidade else total * largura
+        fig.add_trace(go.Scattergl(
+            x=_f32(grade), y=_f32(kde * escala), mode="lines", line=dict(color=cor),
+            name=f"{rotulo} (KDE)", showlegend=False, legendgroup=rotulo, hoverinfo="skip",
+        ))
+
+
+def _boxplot_quantis(fig, grupos, mostrar_media=False):
+    # Caixas a partir dos quartis já calculados: só 6 números por grupo vão ao navegador
+    for i, (rotulo, valores) in enumerate(grupos):
+        e = estatisticas_boxplot(valores, rotulo)
+        cor = CORES[i % len(CORES)]
+        fig.add_trace(go.Box(
+            x=[rotulo], q1=[e["q1"]], median=[e["med"]], q3=[e["q3"]],
+            lowerfence=[e["whislo"]], upperfence=[e["whishi"]],
+            mean=[e["mean"]] if mostrar_media else None,
+            name=rotulo, marker=dict(color=cor), legendgroup=rotulo,
+        ))
+        if len(e["fliers"]):
+            fig.add_trace(go.Scattergl(
+                x=[rotulo] * len(e["fliers"]), y=_f32(e["fliers"]), mode="markers",
+                marker=dict(symbol="diamond", size=5, color="#404040"),
+                name=f"{rotulo} (outliers)", showlegend=False, legendgroup=rotulo,
+            ))
+
+
+# Gráficos da página "Dados"
+
+def grafico_linha(data_for_analysis, coluna):
+    fig = go.Figure()
+    _linha_reduzida(fig, data_for_analysis["Data"], data_for_analysis[coluna], coluna, CORES[0])
+    return _layout(fig, f"{coluna} ao longo do tempo", "Ano", "Valor", serie_temporal=True)
+
+
+def grafico_histograma(valores, coluna):
+    fig = go.Figure()
+    _histograma_reduzido(fig, valores, coluna, CORES[0])
+    fig.update_layout(showlegend=False)
+    return _layout(fig, f"Distribuição de {coluna}", coluna, "Contagem")
+
+
+def grafico_regressao(x, y, coef, intercepto, coluna):
+    fig = go.Figure()
+    # WebGL aguenta mais pontos que o PNG; ainda assim o payload fica limitado
+    indices = amostrar(np.arange(len(x)), LIMITE_PONTOS)
+    fig.add_trace(go.Scattergl(x=_f32(x[indices]), y=_f32(y[indices]), mode="markers",
+                               name="Dados reais", marker=dict(color="blue", size=6)))
+    extremos = np.array([np.min(x), np.max(x)])
+    fig.add_trace(go.Scattergl(x=_f32(extremos), y=_f32(coef * extremos + intercepto), mode="lines",
+                               name="Regressão Linear", line=dict(color="red")))
+    return _layout(fig, f"Regressão Linear: {coluna} vs Ano", "Ano", coluna)
+
+
+def grafico_boxplot_categorias(dados_plot):
+    fig = go.Figure()
+    _boxplot_quantis(fig, [(coluna, dados_plot[coluna].to_numpy()) for coluna in dados_plot.columns])
+    return _layout(fig, "Distribuição dos Valores Exportados: BK, BI, BC, CL", "Categoria", "Valor Exportado")
+
+
+# Gráficos da página "Análise"
+
+def grafico_comparacao_temporal(df_group, coluna1, coluna2):
+    fig = go.Figure()
+    _linha_reduzida(fig, df_group["Data"], df_group[coluna1], coluna1, CORES[0])
+    _linha_reduzida(fig, df_group["Data"], df_group[coluna2], coluna2, CORES[1])
+    return _layout(fig, f"Comparação Temporal: {coluna1} vs {coluna2}", "Data", "Valor Médio", serie_temporal=True)
+
+
+def grafico_boxplot_grupos(df_box):
+    fig = go.Figure()
+    grupos = [(grupo, dados["Valor"].to_numpy()) for grupo, dados in df_box.groupby("Grupo", sort=False)]
+    _boxplot_quantis(fig, grupos, mostrar_media=True)
+    # Pontos de uma amostra limitada por grupo, espalhados horizontalmente no cliente
+    for posicao, (grupo, valores) in enumerate(grupos):
+        amostra = amostrar(valores, semente=posicao)
+        fig.add_trace(go.Box(
+            x=[grupo] * len(amostra), y=_f32(amostra), boxpoints="all", jitter=0.5, pointpos=0,
+            fillcolor="rgba(0,0,0,0)", line=dict(width=0), marker=dict(color="#404040", size=3),
+            name=f"{grupo} (pontos)", showlegend=False, legendgroup=grupo, hoverinfo="y",
+        ))
+    return _layout(fig, "Comparação das Médias de Exportação de Bens de Capital", "Grupo", "Valor Exportado")
+
+
+def grafico_histograma_grupos(valores_brasil, valores_eua):
+    fig = go.Figure()
+    _histograma_reduzido(fig, valores_brasil, "Brasil", "royalblue", densidade=True)
+    _histograma_reduzido(fig, valores_eua, "EUA", "orange", densidade=True)
+    fig.update_layout(barmode="overlay")
+    return _layout(fig, "Distribuição das Exportações de Bens de Capital", "Valor Exportado", "Densidade")
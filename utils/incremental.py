@@ -0,0 +1,246 @@
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.estatisticas import colunas_numericas, indice_estatisticas
+from utils.tendencias import _resolver, eixo_anos
+
+
+# Centróides guardados pelo esboço de quantis (exato enquanto N não passa disso)
+CAPACIDADE_ESBOCO = 2_000
+# Valores distintos com contagem guardada para a moda (exata enquanto não passa disso)
+LIMITE_MODA = 10_000
+VERSAO_ESTADO = 3
+
+
+class EsbocoQuantis:
+    """Esboço de quantis mesclável: lista ordenada de centróides (valor, peso).
+
+    Enquanto o número de valores cabe na capacidade, cada centróide é um valor com peso 1
+    e a mediana é exata (igual à do pandas). Acima disso, centróides vizinhos com peso
+    acumulado parecido são fundidos e a mediana passa a ser aproximada.
+    """
+
+    def __init__(self, centroides=None, capacidade=CAPACIDADE_ESBOCO):
+        self.capacidade = capacidade
+        self.centroides = np.asarray(centroides if centroides is not None else np.empty((0, 2)), dtype=float)
+        self.centroides = self.centroides.reshape(-1, 2)
+
+    def adicionar(self, valores):
+        valores = np.asarray(valores, dtype=float)
+        valores = valores[~np.isnan(valores)]
+        if not len(valores):
+            return
+        novos = np.column_stack([valores, np.ones(len(valores))])
+        todos = np.vstack([self.centroides, novos])
+        self.centroides = todos[np.argsort(todos[:, 0], kind="stable")]
+        if len(self.centroides) > self.capacidade:
+            self._comprimir()
+
+    def _comprimir(self):
+        valores, pesos = self.centroides[:, 0], self.centroides[:, 1]
+        acumulado = np.cumsum(pesos) - pesos
+        grupo = np.floor(acumulado / pesos.sum() * self.capacidade).astype(int)
+        peso_grupo = np.bincount(grupo, pesos)
+        soma_grupo = np.bincount(grupo, valores * pesos)
+        usados = peso_grupo > 0
+        self.centroides = np.column_stack([soma_grupo[usados] / peso_grupo[usados], peso_grupo[usados]])
+
+    def quantil(self, q):
+        if not len(self.centroides):
+            return np.nan
+        valores, pesos = self.centroides[:, 0], self.centroides[:, 1]
+        if np.all(pesos == 1):
+            return float(np.quantile(valores, q))
+        # Interpolação linear entre os pontos médios de cada centróide
+        meios = (np.cumsum(pesos) - pesos / 2) / pesos.sum()
+        return float(np.interp(q, meios, valores))
+
+
+def _somar_contagens(contagens, valores, limite=LIMITE_MODA):
+    """Soma as contagens do lote e mantém no máximo `limite` valores distintos.
+
+    Contagens em arrays ordenados (mais leves de persistir que um dict). Acima do limite
+    ficam os valores mais frequentes (no empate, os menores) e o resto é descartado, então
+    o custo de cada atualização é O(limite + lote), e não O(histórico). Retorna
+    (distintos, contagens, truncou).
+    """
+    distintos, vezes = contagens
+    novos, vezes_novos = np.unique(valores, return_counts=True)
+    todos, inverso = np.unique(np.concatenate([distintos, novos]), return_inverse=True)
+    somadas = np.bincount(inverso, np.concatenate([vezes, vezes_novos])).astype(np.int64)
+    if len(todos) <= limite:
+        return todos, somadas, False
+    # Ordenação estável por contagem decrescente preserva a ordem crescente dos valores no empate
+    mantidos = np.sort(np.argsort(-somadas, kind="stable")[:limite])
+    return todos[mantidos], somadas[mantidos], True
+
+
+def _hash_linhas(df):
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _assinatura_historico(df, chaves):
+    # Soma (mod 2⁶⁴) dos hashes das linhas com chaves já conhecidas: não depende da ordem
+    linhas = df[df["Data"].isin(chaves)]
+    return int(_hash_linhas(linhas).sum(dtype=np.uint64))
+
+
+def _estado_vazio(df):
+    x = eixo_anos(df)
+    return {
+        "versao_estado": VERSAO_ESTADO,
+        "colunas": colunas_numericas(df),
+        "chaves": [],
+        "assinatura": 0,
+        # Deslocamento fixo do ano nas somas da regressão, para evitar cancelamento numérico
+        "x0": float(np.nanmean(x)) if x is not None and np.any(~np.isnan(x)) else 0.0,
+        "agregados": {},
+    }
+
+
+def _atualizar_agregados(estado, novas):
+    x = eixo_anos(novas)
+    for coluna in estado["colunas"]:
+        ag = estado["agregados"].setdefault(coluna, {
+            "n": 0, "media": 0.0,
+            "regressao": [0.0] * 6,
+            "esboco": [],
+            "contagens": (np.empty(0), np.empty(0, dtype=np.int64)),
+            "moda_truncada": False,
+            "minimo": np.inf,
+        })
+        y = novas[coluna].to_numpy(dtype=float)
+        validos = y[~np.isnan(y)]
+
+        # Welford/Chan: combina a média do lote com a acumulada, em O(lote)
+        if len(validos):
+            n_lote = len(validos)
+            n_total = ag["n"] + n_lote
+            ag["media"] += (validos.mean() - ag["media"]) * n_lote / n_total
+            ag["n"] = n_total
+
+        # Produtos cruzados da regressão contra o ano: n, Σx, Σy, Σx², Σxy, Σy²
+        if x is not None:
+            mascara = ~np.isnan(y) & ~np.isnan(x)
+            xc, yv = x[mascara] - estado["x0"], y[mascara]
+            somas = [len(xc), xc.sum(), yv.sum(), (xc * xc).sum(), (xc * yv).sum(), (yv * yv).sum()]
+            ag["regressao"] = [float(a + b) for a, b in zip(ag["regressao"], somas)]
+
+        esboco = EsbocoQuantis(ag["esboco"])
+        esboco.adicionar(validos)
+        ag["esboco"] = esboco.centroides
+
+        distintos, vezes, truncou = _somar_contagens(ag["contagens"], validos)
+        ag["contagens"] = (distintos, vezes)
+        ag["moda_truncada"] = ag["moda_truncada"] or truncou
+        if len(validos):
+            ag["minimo"] = min(ag["minimo"], float(validos.min()))
+
+
+def _indice_do_estado(estado):
+    linhas = {}
+    for coluna in estado["colunas"]:
+        ag = estado["agregados"].get(coluna)
+        if ag is None or ag["n"] == 0:
+            linhas[coluna] = dict(n=0, media=np.nan, mediana=np.nan, moda=np.nan,
+                                  n_regressao=0, coef=np.nan, intercepto=np.nan, r2=np.nan)
+            continue
+        n_reg, sx, sy, sxx, sxy, syy = (np.array([v]) for v in ag["regressao"])
+        coef, intercepto, r2 = _resolver(n_reg, sx, sy, sxx, sxy, syy, estado["x0"])
+        # Moda como no pandas: maior contagem e, no empate, o menor valor. Se as contagens
+        # foram truncadas e nenhum valor repetiu, todos empatam em 1 e a moda é o mínimo
+        distintos, contagens = ag["contagens"]
+        moda = distintos[np.argmax(contagens)]
+        if ag["moda_truncada"] and contagens.max() == 1:
+            moda = ag["minimo"]
+        linhas[coluna] = dict(
+            n=ag["n"],
+            media=ag["media"],
+            mediana=EsbocoQuantis(ag["esboco"]).quantil(0.5),
+            moda=moda,
+            n_regressao=int(n_reg[0]),
+            coef=coef[0],
+            intercepto=intercepto[0],
+            r2=r2[0],
+        )
+    indice = pd.DataFrame.from_dict(linhas, orient="index")
+    indice.index.name = "coluna"
+    return indice
+
+
+def _ler_estado(caminho_estado):
+    # Qualquer falha (arquivo truncado, de outra versão, pickle de outro formato) vira recálculo
+    try:
+        with open(caminho_estado, "rb") as f:
+            estado = pickle.load(f)
+    except Exception:
+        return None
+    return estado if isinstance(estado, dict) else None
+
+
+def _gravar_estado(caminho_estado, estado):
+    # Arquivo temporário + os.replace: quem lê vê o estado antigo ou o novo, nunca um pela metade
+    try:
+        caminho_estado.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporario = tempfile.mkstemp(dir=caminho_estado.parent, prefix=caminho_estado.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(estado, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, caminho_estado)
+        except BaseException:
+            os.unlink(temporario)
+            raise
+    except OSError:
+        pass
+
+
+def atualizar_estatisticas(df, caminho_estado):
+    """Atualiza os agregados persistidos e devolve o índice de estatísticas.
+
+    Linhas com uma data nova são tratadas como acréscimo e entram nos agregados em
+    O(linhas novas + tamanho do estado), que é limitado por LIMITE_MODA e CAPACIDADE_ESBOCO
+    por coluna. Conferir que o histórico não mudou ainda exige um hash vetorizado de todas
+    as linhas antigas (O(N), mas barato). Se alguma linha de uma data já conhecida mudou
+    (ou se as colunas mudaram), tudo é recalculado a partir do DataFrame completo.
+    Retorna (índice, modo), com modo "inalterado", "incremental" ou "completo".
+    """
+    caminho_estado = Path(caminho_estado)
+    estado = _ler_estado(caminho_estado)
+
+    compativel = (
+        estado is not None
+        and estado.get("versao_estado") == VERSAO_ESTADO
+        and estado["colunas"] == colunas_numericas(df)
+        and "Data" in df.columns
+    )
+    if compativel:
+        # Acréscimo só se todas as datas conhecidas continuam lá, com as mesmas linhas
+        chaves = pd.Series(estado["chaves"], dtype=df["Data"].dtype)
+        compativel = (
+            bool(chaves.isin(df["Data"]).all())
+            and _assinatura_historico(df, chaves) == estado["assinatura"]
+        )
+
+    if compativel:
+        novas = df[~df["Data"].isin(chaves)]
+        if novas.empty:
+            return _indice_do_estado(estado), "inalterado"
+        modo = "incremental"
+    elif "Data" not in df.columns:
+        # Sem chave de data não há como detectar acréscimos: cálculo direto, sem estado
+        return indice_estatisticas(df), "completo"
+    else:
+        estado = _estado_vazio(df)
+        novas = df
+        modo = "completo"
+
+    _atualizar_agregados(estado, novas)
+    estado["chaves"] = pd.unique(df["Data"].dropna()).tolist()
+    estado["assinatura"] = _assinatura_historico(df, estado["chaves"])
+    _gravar_estado(caminho_estado, estado)
+    return _indice_do_estado(estado), modo
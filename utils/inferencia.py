@@ -0,0 +1,141 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+
+# Reamostras por bloco: cada bloco recebe sua própria semente derivada, então o resultado
+# é o mesmo rodando em série ou distribuído entre processos
+REAMOSTRAS_POR_BLOCO = 2_000
+# Teto de elementos por matriz de índices/permutações de um bloco (~16 MB em int64)
+ELEMENTOS_POR_BLOCO = 2_000_000
+# Acima deste volume (reamostras × tamanho da amostra) os blocos vão para um pool de processos
+LIMITE_PARALELO = 50_000_000
+
+IntervaloConfianca = namedtuple("IntervaloConfianca", ["estimativa", "inferior", "superior"])
+ResultadoPermutacao = namedtuple("ResultadoPermutacao", ["diferenca", "p_valor"])
+
+# Pool de processos criado na primeira chamada paralela e reaproveitado pelas seguintes
+_POOL = {}
+_LOCK_POOL = threading.Lock()
+
+
+def _limpar(valores):
+    valores = np.asarray(valores, dtype=float)
+    return valores[~np.isnan(valores)]
+
+
+def _pool(processos):
+    # spawn: as páginas chamam isto de dentro de uma thread do servidor Streamlit, e
+    # fazer fork de um processo com várias threads pode travar o processo filho
+    with _LOCK_POOL:
+        pool = _POOL.get("executor")
+        if pool is None or _POOL["processos"] != processos:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            contexto = multiprocessing.get_context("spawn")
+            pool = ProcessPoolExecutor(max_workers=processos, mp_context=contexto)
+            _POOL.update(executor=pool, processos=processos)
+        return pool
+
+
+def _encerrar_pool(wait=True):
+    with _LOCK_POOL:
+        pool = _POOL.pop("executor", None)
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+atexit.register(_encerrar_pool)
+
+
+def _bloco_bootstrap(args):
+    a, b, tamanho, semente = args
+    rng = np.random.default_rng(semente)
+    # Matriz de índices (tamanho × n): cada linha é uma reamostra com reposição
+    medias = a[rng.integers(0, len(a), size=(tamanho, len(a)))].mean(axis=1)
+    if b is not None:
+        medias -= b[rng.integers(0, len(b), size=(tamanho, len(b)))].mean(axis=1)
+    return medias
+
+
+def _bloco_permutacao(args):
+    combinados, n_a, tamanho, semente = args
+    rng = np.random.default_rng(semente)
+    permutados = rng.permuted(np.broadcast_to(combinados, (tamanho, len(combinados))), axis=1)
+    return permutados[:, :n_a].mean(axis=1) - permutados[:, n_a:].mean(axis=1)
+
+
+def reamostras_por_orcamento(tamanho_amostra, maximo=10_000, minimo=500, orcamento=50_000_000):
+    """Número de reamostras que cabe no orçamento de elementos sorteados, entre `minimo` e `maximo`."""
+    return int(np.clip(orcamento // max(tamanho_amostra, 1), minimo, maximo))
+
+
+def _executar(funcao, dados, n_reamostras, semente, processos, tamanho_amostra):
+    por_bloco = int(np.clip(ELEMENTOS_POR_BLOCO // max(tamanho_amostra, 1), 1, REAMOSTRAS_POR_BLOCO))
+    blocos = [min(por_bloco, n_reamostras - i) for i in range(0, n_reamostras, por_bloco)]
+    sementes = np.random.SeedSequence(semente).spawn(len(blocos))
+    tarefas = [(*dados, tamanho, s) for tamanho, s in zip(blocos, sementes)]
+
+    if processos is None:
+        paralelo = n_reamostras * tamanho_amostra > LIMITE_PARALELO
+        processos = (os.cpu_count() or 1) if paralelo else 1
+    if processos > 1 and len(blocos) > 1:
+        try:
+            return np.concatenate(list(_pool(processos).map(funcao, tarefas)))
+        except BrokenProcessPool:
+            # Um processo do pool morreu: descarta o pool (o próximo é recriado) e refaz em série
+            _encerrar_pool(wait=False)
+    return np.concatenate([funcao(t) for t in tarefas])
+
+
+def bootstrap_media(valores, n_reamostras=10_000, confianca=0.95, semente=42, processos=None):
+    """Intervalo de confiança bootstrap (percentil) para a média de uma amostra."""
+    a = _limpar(valores)
+    if not len(a):
+        return IntervaloConfianca(np.nan, np.nan, np.nan)
+    medias = _executar(_bloco_bootstrap, (a, None), n_reamostras, semente, processos, len(a))
+    alfa = (1 - confianca) / 2
+    inferior, superior = np.quantile(medias, [alfa, 1 - alfa])
+    return IntervaloConfianca(a.mean(), inferior, superior)
+
+
+def bootstrap_diferenca(valores_a, valores_b, n_reamostras=10_000, confianca=0.95, semente=42, processos=None):
+    """Intervalo de confiança bootstrap (percentil) para a diferença de médias A − B."""
+    a, b = _limpar(valores_a), _limpar(valores_b)
+    if not len(a) or not len(b):
+        return IntervaloConfianca(np.nan, np.nan, np.nan)
+    diferencas = _executar(_bloco_bootstrap, (a, b), n_reamostras, semente, processos, len(a) + len(b))
+    alfa = (1 - confianca) / 2
+    inferior, superior = np.quantile(diferencas, [alfa, 1 - alfa])
+    return IntervaloConfianca(a.mean() - b.mean(), inferior, superior)
+
+
+def teste_permutacao(valores_a, valores_b, n_permutacoes=10_000, alternativa="greater", semente=42, processos=None):
+    """Teste de permutação para a diferença de médias A − B.
+
+    `alternativa` segue a convenção do scipy: "greater" (H₁: média A > média B), "less"
+    ou "two-sided". O valor-p usa a correção (k + 1) / (n + 1). Com um grupo vazio (ou só NaN)
+    não há diferença a testar e o resultado é NaN, como no scipy.stats.ttest_ind.
+    """
+    a, b = _limpar(valores_a), _limpar(valores_b)
+    if alternativa not in ("greater", "less", "two-sided"):
+        raise ValueError(f"alternativa inválida: {alternativa!r}")
+    if not len(a) or not len(b):
+        return ResultadoPermutacao(np.nan, np.nan)
+    observada = a.mean() - b.mean()
+    combinados = np.concatenate([a, b])
+    nulas = _executar(_bloco_permutacao, (combinados, len(a)), n_permutacoes, semente, processos, len(combinados))
+
+    if alternativa == "greater":
+        extremos = np.count_nonzero(nulas >= observada)
+    elif alternativa == "less":
+        extremos = np.count_nonzero(nulas <= observada)
+    else:
+        extremos = np.count_nonzero(np.abs(nulas) >= abs(observada))
+    return ResultadoPermutacao(observada, (extremos + 1) / (n_permutacoes + 1))
@@ -0,0 +1,156 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+
+# Quantidade de linhas lidas por bloco na ingestão em streaming
+TAMANHO_BLOCO = 100_000
+CATEGORIAS = ("BK", "BI", "BC", "CL")
+
+
+def colunas_fonte(caminho):
+    """Lê apenas o cabeçalho do arquivo (primeira aba, no caso de planilhas)."""
+    for bloco in ler_blocos(caminho, tamanho_bloco=1):
+        return list(bloco.columns)
+    return []
+
+
+def _blocos_excel(caminho, tamanho_bloco, abas):
+    from openpyxl import load_workbook
+
+    # read_only faz o openpyxl percorrer o XML linha a linha, sem montar a planilha inteira
+    wb = load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        for nome in abas or wb.sheetnames:
+            linhas = wb[nome].iter_rows(values_only=True)
+            cabecalho = next(linhas, None)
+            if cabecalho is None:
+                continue
+            # Ignora colunas sem cabeçalho (células formatadas, mas vazias, à direita)
+            indices = [i for i, c in enumerate(cabecalho) if c is not None]
+            colunas = [str(cabecalho[i]) for i in indices]
+            buffer = []
+            for linha in linhas:
+                linha = [linha[i] if i < len(linha) else None for i in indices]
+                if all(v is None for v in linha):
+                    continue
+                buffer.append(linha)
+                if len(buffer) >= tamanho_bloco:
+                    yield pd.DataFrame(buffer, columns=colunas)
+                    buffer = []
+            if buffer:
+                yield pd.DataFrame(buffer, columns=colunas)
+    finally:
+        wb.close()
+
+
+def _blocos_parquet(caminho, tamanho_bloco):
+    import pyarrow.parquet as pq
+
+    for lote in pq.ParquetFile(caminho).iter_batches(batch_size=tamanho_bloco):
+        yield lote.to_pandas()
+
+
+def ler_blocos(caminho, tamanho_bloco=TAMANHO_BLOCO, abas=None):
+    """Percorre um arquivo .xlsx/.csv/.parquet em blocos de até `tamanho_bloco` linhas.
+
+    Para planilhas, todas as abas (ou apenas as listadas em `abas`) são lidas em sequência
+    e devem ter o mesmo cabeçalho.
+    """
+    sufixo = Path(caminho).suffix.lower()
+    if sufixo in (".xlsx", ".xlsm"):
+        yield from _blocos_excel(caminho, tamanho_bloco, abas)
+    elif sufixo == ".csv":
+        with pd.read_csv(caminho, chunksize=tamanho_bloco) as leitor:
+            yield from leitor
+    elif sufixo == ".parquet":
+        yield from _blocos_parquet(caminho, tamanho_bloco)
+    else:
+        raise ValueError(f"Formato de arquivo não suportado para ingestão: {sufixo}")
+
+
+def reduzir_tipos(bloco, categoricas=()):
+    """Converte o bloco para tipos compactos: float32, inteiros mínimos e categorias."""
+    bloco = bloco.copy()
+    for coluna in bloco.columns:
+        serie = bloco[coluna]
+        if coluna in categoricas:
+            bloco[coluna] = serie.astype("category")
+        elif pd.api.types.is_float_dtype(serie):
+            bloco[coluna] = serie.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(serie):
+            bloco[coluna] = pd.to_numeric(serie, downcast="integer")
+        elif pd.api.types.is_object_dtype(serie) or pd.api.types.is_string_dtype(serie):
+            numerico = pd.to_numeric(serie, errors="coerce")
+            if numerico.notna().sum() == serie.notna().sum():
+                bloco[coluna] = numerico.astype(np.float32)
+    return bloco
+
+
+def ler_tabela(caminho, tamanho_bloco=TAMANHO_BLOCO, categoricas=()):
+    """Monta um DataFrame já com tipos reduzidos, bloco a bloco.
+
+    Cada bloco é convertido antes de ser guardado, então o pico de memória fica perto do
+    tamanho final compacto, e não do arquivo inteiro em float64/object.
+    """
+    partes = {}
+    for bloco in ler_blocos(caminho, tamanho_bloco):
+        bloco = reduzir_tipos(bloco, categoricas)
+        for coluna in bloco.columns:
+            partes.setdefault(coluna, []).append(bloco[coluna])
+
+    colunas = {}
+    for coluna, series in partes.items():
+        if isinstance(series[0].dtype, pd.CategoricalDtype):
+            colunas[coluna] = pd.Series(union_categoricals(series))
+        elif all(pd.api.types.is_numeric_dtype(s) for s in series):
+            tipo = np.result_type(*[s.dtype for s in series])
+            colunas[coluna] = pd.Series(np.concatenate([s.to_numpy(dtype=tipo) for s in series]))
+        else:
+            colunas[coluna] = pd.concat(series, ignore_index=True)
+    return pd.DataFrame(colunas)
+
+
+def _anos(serie):
+    if pd.api.types.is_numeric_dtype(serie):
+        return serie
+    return pd.to_datetime(serie, errors="coerce").dt.year
+
+
+def agregar_anual(caminho, coluna_data="Data", coluna_valor="Valor", coluna_categoria="Categoria",
+                  categorias=CATEGORIAS, divisor=1.0, tamanho_bloco=TAMANHO_BLOCO):
+    """Agrega um arquivo mensal/NCM (formato longo) no esquema anual usado pelas páginas.
+
+    O arquivo precisa ter uma coluna de data (ou ano), uma de valor e uma com a categoria
+    de uso (BK, BI, BC, CL). Cada bloco é reduzido a somas por (ano, categoria) e
+    descartado, então a memória depende do número de anos, não do número de linhas.
+    O resultado tem as colunas Data, Valor_*, Var* (variação anual) e Part_* (% do total),
+    ordenado do ano mais recente para o mais antigo, como na planilha anual.
+    """
+    totais = None
+    for bloco in ler_blocos(caminho, tamanho_bloco):
+        bloco = bloco[bloco[coluna_categoria].isin(categorias)]
+        somas = (
+            pd.to_numeric(bloco[coluna_valor], errors="coerce")
+            .groupby([_anos(bloco[coluna_data]), bloco[coluna_categoria]])
+            .sum()
+        )
+        totais = somas if totais is None else totais.add(somas, fill_value=0)
+
+    if totais is None:
+        raise ValueError(f"Nenhuma linha com categorias {categorias} encontrada em {caminho}")
+
+    valores = totais.unstack(fill_value=0.0).reindex(columns=list(categorias), fill_value=0.0).sort_index()
+    valores = valores / divisor
+    total = valores.sum(axis=1)
+
+    anual = pd.DataFrame({"Data": valores.index.astype(int)})
+    for categoria in categorias:
+        anual[f"Valor_{categoria}"] = valores[categoria].to_numpy()
+    for categoria in categorias:
+        anual[f"Var{categoria}"] = valores[categoria].pct_change().to_numpy()
+    for categoria in categorias:
+        anual[f"Part_{categoria}"] = (valores[categoria] / total * 100).to_numpy()
+    return anual.iloc[::-1].reset_index(drop=True)
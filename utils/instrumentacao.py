@@ -0,0 +1,140 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+import streamlit as st
+
+
+# Arquivo JSONL com uma linha por seção medida (EXPORTACAO_METRICAS="" desliga a gravação)
+ARQUIVO_METRICAS = os.environ.get("EXPORTACAO_METRICAS", ".cache/metricas.jsonl")
+# Ao passar deste tamanho o arquivo vira metricas.jsonl.1 (substituindo o anterior) e
+# um novo é iniciado, então o disco usado e a leitura do painel ficam limitados
+TAMANHO_MAXIMO_METRICAS = 8 * 1024 * 1024
+# Quantidade de medições mais recentes usadas no agregado de todas as sessões
+LIMITE_AGREGADO = 50_000
+PERCENTIS = [0.5, 0.9, 0.99]
+
+_lock_arquivo = threading.Lock()
+
+
+def memoria_ativa():
+    """Pico de memória só com EXPORTACAO_DEBUG=1: o tracemalloc vale para o processo inteiro."""
+    return os.environ.get("EXPORTACAO_DEBUG") == "1"
+
+
+def debug_ativo():
+    """O painel de métricas fica visível quando o usuário ativa o modo debug."""
+    return st.session_state.get("debug_metricas", False) or memoria_ativa()
+
+
+def _id_sessao():
+    if "id_sessao" not in st.session_state:
+        st.session_state["id_sessao"] = uuid.uuid4().hex[:8]
+    return st.session_state["id_sessao"]
+
+
+def _gravar(registro):
+    if not ARQUIVO_METRICAS:
+        return
+    caminho = Path(ARQUIVO_METRICAS)
+    try:
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        with _lock_arquivo:
+            if caminho.exists() and caminho.stat().st_size > TAMANHO_MAXIMO_METRICAS:
+                os.replace(caminho, caminho.with_name(caminho.name + ".1"))
+            with open(caminho, "a", encoding="utf-8") as f:
+                f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    except OSError:
+        # Sem permissão de escrita: as métricas continuam disponíveis no painel da sessão
+        pass
+
+
+@contextmanager
+def medir(pagina, secao):
+    """Mede o tempo (e, com EXPORTACAO_DEBUG=1, o pico de memória alocada) de uma seção da página.
+
+    O registro vai para a lista da sessão, exibida no painel, e para o arquivo JSONL.
+    O tracemalloc é global ao processo e deixa todas as sessões mais lentas, por isso não
+    depende do toggle de uma sessão: fica restrito a servidores iniciados para depuração.
+    Com várias sessões simultâneas o pico de memória é aproximado; o tempo de parede é
+    sempre da própria seção.
+    """
+    rastrear = memoria_ativa()
+    if rastrear:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        memoria_inicial, _ = tracemalloc.get_traced_memory()
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registro = {
+            "instante": time.time(),
+            "sessao": _id_sessao(),
+            "pagina": pagina,
+            "secao": secao,
+            "tempo_ms": (time.perf_counter() - inicio) * 1000,
+        }
+        if rastrear:
+            _, pico = tracemalloc.get_traced_memory()
+            registro["pico_kb"] = max(pico - memoria_inicial, 0) / 1024
+        st.session_state.setdefault("metricas", []).append(registro)
+        _gravar(registro)
+
+
+def _percentis(registros):
+    import pandas as pd
+
+    df = pd.DataFrame(list(registros))
+    if df.empty:
+        return df
+    agrupado = df.groupby(["pagina", "secao"])["tempo_ms"]
+    tabela = agrupado.quantile(PERCENTIS).unstack()
+    tabela.columns = [f"p{int(p * 100)} (ms)" for p in PERCENTIS]
+    tabela.insert(0, "N", agrupado.count())
+    if "pico_kb" in df.columns:
+        tabela["pico máx. (KB)"] = df.groupby(["pagina", "secao"])["pico_kb"].max()
+    return tabela.round(1)
+
+
+def _ler_metricas():
+    if not ARQUIVO_METRICAS:
+        return []
+    caminho = Path(ARQUIVO_METRICAS)
+    # O arquivo rotacionado vem primeiro: logo após uma rotação o histórico continua nele,
+    # e as linhas do arquivo atual empurram para fora as mais antigas
+    linhas = deque(maxlen=LIMITE_AGREGADO)
+    with _lock_arquivo:
+        for arquivo in (caminho.with_name(caminho.name + ".1"), caminho):
+            if arquivo.exists():
+                with open(arquivo, encoding="utf-8") as f:
+                    linhas.extend(f)
+    return [json.loads(linha) for linha in linhas if linha.strip()]
+
+
+def painel_instrumentacao():
+    """Painel opcional na barra lateral com os percentis da sessão e de todas as sessões."""
+    st.sidebar.toggle("Modo debug (métricas) 🛠️", key="debug_metricas")
+    if not debug_ativo():
+        return
+
+    with st.sidebar.expander("Tempos por seção", expanded=True):
+        st.write("**Esta sessão**")
+        st.dataframe(_percentis(st.session_state.get("metricas", [])))
+        agregado = _ler_metricas()
+        st.write(f"**Todas as sessões** (últimas {len(agregado)} medições)")
+        st.dataframe(_percentis(agregado))
+        if agregado:
+            st.download_button(
+                "Exportar métricas (JSONL)",
+                data="\n".join(json.dumps(r, ensure_ascii=False) for r in agregado),
+                file_name="metricas.jsonl",
+                mime="application/jsonl",
+            )
@@ -0,0 +1,148 @@
+import numpy as np
+
+
+# Quantidade máxima de pontos desenhados por série: na ordem da largura do gráfico em pixels
+LIMITE_PONTOS = 1_000
+# Pontos individuais (swarm/strip/dispersão) exibidos por grupo
+LIMITE_AMOSTRA = 300
+# Resolução da grade usada pela KDE binada
+PONTOS_GRADE_KDE = 512
+
+
+def lttb(x, y, limite=LIMITE_PONTOS):
+    """Reduz uma série ordenada por x com o algoritmo Largest-Triangle-Three-Buckets.
+
+    Mantém o primeiro e o último ponto e, em cada balde intermediário, o ponto que forma
+    o maior triângulo com o ponto escolhido no balde anterior e a média do próximo balde.
+    O formato visual da linha (picos e vales) é preservado com `limite` pontos.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if limite >= n or limite < 3:
+        return x, y
+
+    bordas = np.linspace(1, n - 1, limite - 1).astype(int)
+    escolhidos = np.empty(limite, dtype=int)
+    escolhidos[0], escolhidos[-1] = 0, n - 1
+    anterior = 0
+    for i in range(limite - 2):
+        inicio, fim = bordas[i], bordas[i + 1]
+        proximo_fim = bordas[i + 2] if i + 2 < len(bordas) else n
+        media_x = x[fim:proximo_fim].mean()
+        media_y = y[fim:proximo_fim].mean()
+        # Área (dobrada) dos triângulos formados com o ponto anterior e a média do próximo balde
+        areas = np.abs(
+            (x[anterior] - media_x) * (y[inicio:fim] - y[anterior])
+            - (x[anterior] - x[inicio:fim]) * (media_y - y[anterior])
+        )
+        anterior = inicio + int(np.argmax(areas))
+        escolhidos[i + 1] = anterior
+    return x[escolhidos], y[escolhidos]
+
+
+def reduzir_serie(x, y, limite=LIMITE_PONTOS):
+    """Prepara uma série temporal para desenho: média por x repetido e LTTB se ainda for longa.
+
+    Retorna (x, média, meia-largura do IC de 95%); a banda é None quando cada x tem um único
+    valor. O IC usa a aproximação normal, no lugar do bootstrap que o seaborn faria por ponto.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    validos = ~np.isnan(x) & ~np.isnan(y)
+    x, y = x[validos], y[validos]
+    ordem = np.argsort(x, kind="stable")
+    x, y = x[ordem], y[ordem]
+
+    banda = None
+    unicos, inicio, contagem = np.unique(x, return_index=True, return_counts=True)
+    if len(unicos) < len(x):
+        media = np.add.reduceat(y, inicio) / contagem
+        # Duas passadas: desvios em torno da média de cada x (Σx² − N·x̄² perde precisão em valores grandes)
+        desvios = y - np.repeat(media, contagem)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variancia = np.add.reduceat(desvios * desvios, inicio) / (contagem - 1)
+            banda = np.where(contagem > 1, 1.96 * np.sqrt(variancia / contagem), 0.0)
+        x, y = unicos, media
+
+    if len(x) > limite:
+        x_red, y_red = lttb(x, y, limite)
+        if banda is not None:
+            banda = banda[np.searchsorted(x, x_red)]
+        x, y = x_red, y_red
+    return x, y, banda
+
+
+def histograma_binado(valores, bins=20):
+    """Contagens e bordas via np.histogram, ignorando valores ausentes."""
+    valores = np.asarray(valores, dtype=float)
+    return np.histogram(valores[~np.isnan(valores)], bins=bins)
+
+
+def kde_binada(valores, pontos=PONTOS_GRADE_KDE, corte=3.0):
+    """Estimativa de densidade por kernel gaussiano, binada e convoluída por FFT.
+
+    Os valores são distribuídos linearmente numa grade regular e a grade é convoluída
+    com o kernel gaussiano (largura de banda pela regra de Scott, a mesma do seaborn),
+    então o custo é O(n + grade·log grade), independente do número de pares de pontos.
+    Retorna (grade, densidade).
+    """
+    valores = np.asarray(valores, dtype=float)
+    valores = valores[~np.isnan(valores)]
+    n = len(valores)
+    if n < 2 or np.ptp(valores) == 0:
+        return np.array([]), np.array([])
+
+    banda = np.std(valores, ddof=1) * n ** (-1 / 5)
+    minimo, maximo = valores.min() - corte * banda, valores.max() + corte * banda
+    grade = np.linspace(minimo, maximo, pontos)
+    passo = grade[1] - grade[0]
+
+    # Binagem linear: cada valor divide seu peso entre os dois pontos vizinhos da grade
+    posicao = (valores - minimo) / passo
+    esquerda = np.clip(np.floor(posicao).astype(int), 0, pontos - 2)
+    peso_direita = posicao - esquerda
+    pesos = np.bincount(esquerda, 1 - peso_direita, minlength=pontos)
+    pesos += np.bincount(esquerda + 1, peso_direita, minlength=pontos)
+
+    deslocamentos = np.arange(-pontos + 1, pontos) * passo
+    kernel = np.exp(-0.5 * (deslocamentos / banda) ** 2) / (banda * np.sqrt(2 * np.pi))
+    tamanho = 2 ** int(np.ceil(np.log2(len(pesos) + len(kernel) - 1)))
+    convolucao = np.fft.irfft(np.fft.rfft(pesos, tamanho) * np.fft.rfft(kernel, tamanho), tamanho)
+    densidade = convolucao[pontos - 1:2 * pontos - 1] / n
+    return grade, np.maximum(densidade, 0)
+
+
+def amostrar(valores, limite=LIMITE_AMOSTRA, semente=0):
+    """Até `limite` valores sorteados sem reposição (todos, se houver menos)."""
+    valores = np.asarray(valores)
+    if len(valores) <= limite:
+        return valores
+    rng = np.random.default_rng(semente)
+    return valores[np.sort(rng.choice(len(valores), size=limite, replace=False))]
+
+
+def estatisticas_boxplot(valores, rotulo, limite_outliers=LIMITE_AMOSTRA, whis=1.5):
+    """Quartis, bigodes e média no formato aceito por `Axes.bxp`, com outliers amostrados.
+
+    Sem valores válidos (grupo vazio ou só NaN) as estatísticas são NaN e a caixa fica vazia.
+    """
+    valores = np.asarray(valores, dtype=float)
+    valores = valores[~np.isnan(valores)]
+    if not len(valores):
+        return {"label": rotulo, "med": np.nan, "q1": np.nan, "q3": np.nan, "whislo": np.nan,
+                "whishi": np.nan, "mean": np.nan, "fliers": valores}
+    q1, mediana, q3 = np.quantile(valores, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    dentro = valores[(valores >= q1 - whis * iqr) & (valores <= q3 + whis * iqr)]
+    fora = valores[(valores < q1 - whis * iqr) | (valores > q3 + whis * iqr)]
+    return {
+        "label": rotulo,
+        "med": mediana,
+        "q1": q1,
+        "q3": q3,
+        "whislo": dentro.min() if len(dentro) else q1,
+        "whishi": dentro.max() if len(dentro) else q3,
+        "mean": valores.mean(),
+        "fliers": amostrar(fora, limite_outliers),
+    }
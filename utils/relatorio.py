@@ -0,0 +1,318 @@
+"""Relatório estático em lote, sem a interface do Streamlit.
+
+Gera, para cada coluna numérica e cada janela de anos, as métricas e os gráficos de linha,
+histograma e regressão da página Dados, as comparações entre categorias e o teste t
+Brasil x EUA da página Análise, em HTML + PNG. As tarefas são distribuídas num pool de
+processos e cada processo lê uma única vez a cópia Parquet e o armazém já preparados:
+
+    python -m utils.relatorio --saida relatorios --janela 10 --passo 5
+
+Artefatos cuja assinatura (versão dos dados + parâmetros da tarefa) não mudou são pulados; o
+armazém só entra na assinatura dos testes Brasil x EUA. Use --forcar para refazer tudo.
+"""
+import argparse
+import hashlib
+import html
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import scipy.stats as stats
+
+from utils.armazem import ArmazemExportacoes
+from utils.carregamento import ARQUIVO_DADOS, DIRETORIO_CACHE, ler_dados, versao_dados
+from utils.consultas import IndiceDatas
+from utils.estatisticas import colunas_numericas, indice_estatisticas
+from utils.graficos import (
+    grafico_boxplot_categorias,
+    grafico_boxplot_grupos,
+    grafico_comparacao_temporal,
+    grafico_histograma,
+    grafico_histograma_grupos,
+    grafico_linha,
+    grafico_regressao,
+)
+from utils.inferencia import bootstrap_diferenca, reamostras_por_orcamento, teste_permutacao
+from utils.tendencias import eixo_anos
+
+
+DIRETORIO_SAIDA = "relatorios"
+# Incrementar quando o conteúdo gerado mudar, para invalidar os artefatos antigos
+VERSAO_RELATORIO = 1
+DPI = 120
+
+# Dados compartilhados dentro de cada processo do pool (preenchidos por _iniciar)
+_DADOS = {}
+
+
+def janelas_anos(datas, tamanho=10, passo=5):
+    """Período completo mais janelas de `tamanho` datas consecutivas, avançando `passo` datas."""
+    datas = np.unique(np.asarray(datas))
+    if not len(datas):
+        return []
+    janelas = [(datas[0], datas[-1])]
+    for i in range(0, max(len(datas) - tamanho, 0) + 1, passo):
+        janela = (datas[i], datas[min(i + tamanho, len(datas)) - 1])
+        if janela not in janelas:
+            janelas.append(janela)
+    # Garante uma janela terminando na data mais recente
+    ultima = (datas[max(len(datas) - tamanho, 0)], datas[-1])
+    if ultima not in janelas:
+        janelas.append(ultima)
+    return [(int(inicio), int(fim)) for inicio, fim in janelas]
+
+
+def montar_tarefas(df, armazem, janelas):
+    """Lista de tarefas (tipo, alvo, início, fim) que compõem a matriz do relatório."""
+    colunas = colunas_numericas(df)
+    categorias = [c for c in colunas if c.startswith("Valor_")]
+    testes = [c for c in categorias if "EUA" in armazem.paises(c.removeprefix("Valor_"))]
+    tarefas = []
+    for inicio, fim in janelas:
+        tarefas += [("coluna", coluna, inicio, fim) for coluna in colunas]
+        if categorias:
+            tarefas.append(("categorias", tuple(categorias), inicio, fim))
+        tarefas += [("comparacao", par, inicio, fim) for par in combinations(categorias, 2)]
+        tarefas += [("teste", coluna, inicio, fim) for coluna in testes]
+    return tarefas
+
+
+def _nome(tarefa):
+    tipo, alvo, _, _ = tarefa
+    if tipo == "coluna":
+        return alvo
+    if tipo == "comparacao":
+        return "_x_".join(alvo)
+    if tipo == "categorias":
+        return "categorias"
+    return f"{tipo}_{alvo}"
+
+
+def _diretorio(saida, tarefa):
+    _, _, inicio, fim = tarefa
+    return Path(saida) / f"{inicio}-{fim}" / _nome(tarefa)
+
+
+def _assinatura(versao, tarefa):
+    return hashlib.sha256(repr((VERSAO_RELATORIO, versao, tarefa)).encode()).hexdigest()[:16]
+
+
+def _versao_tarefa(tarefa, versao, assinatura_armazem):
+    # Só o teste t lê o armazém: importar dados de outro país não invalida os demais artefatos
+    return (*versao, assinatura_armazem) if tarefa[0] == "teste" else versao
+
+
+def _atualizado(saida, tarefa, versao):
+    marcador = _diretorio(saida, tarefa) / ".assinatura"
+    return marcador.exists() and marcador.read_text() == _assinatura(versao, tarefa)
+
+
+def _armazem_relatorio(arquivo):
+    # A base padrão usa o armazém do app. Outra base ganha uma cópia própria (com os demais
+    # países), para que sincronizá-la não substitua a série do Brasil que o app consulta
+    armazem = ArmazemExportacoes()
+    if Path(arquivo).resolve() == Path(ARQUIVO_DADOS).resolve():
+        return armazem
+    return armazem.copiar_para(DIRETORIO_CACHE / f"relatorio-{Path(arquivo).stem}.sqlite")
+
+
+def _iniciar(arquivo, caminho_armazem):
+    # A cópia Parquet já foi gerada pelo processo principal: aqui é só uma leitura rápida
+    df = ler_dados(arquivo)
+    _DADOS["df"] = df
+    _DADOS["indice"] = IndiceDatas(df, colunas_numericas(df))
+    _DADOS["armazem"] = ArmazemExportacoes(caminho_armazem)
+    _estatisticas_janela.cache_clear()
+
+
+@lru_cache(maxsize=16)
+def _estatisticas_janela(inicio, fim):
+    # Calculada uma vez por janela em cada processo e reaproveitada por todas as colunas
+    return indice_estatisticas(_DADOS["indice"].filtrar(inicio, fim))
+
+
+def _salvar(fig, caminho):
+    fig.savefig(caminho, dpi=DPI, bbox_inches="tight")
+    return caminho.name
+
+
+def _pagina(titulo, partes):
+    corpo = "\n".join(partes)
+    return (f"<!DOCTYPE html>\n<html lang=\"pt-br\"><head><meta charset=\"utf-8\">"
+            f"<title>{html.escape(titulo)}</title></head>\n<body>\n<h1>{html.escape(titulo)}</h1>\n"
+            f"{corpo}\n</body></html>\n")
+
+
+def _imagem(nome, descricao):
+    return f"<img src=\"{nome}\" alt=\"{html.escape(descricao)}\" style=\"max-width:100%\">"
+
+
+def _tabela(dados):
+    return pd.DataFrame(dados).to_html(index=False, float_format=lambda v: f"{v:,.4f}", border=0)
+
+
+def _relatorio_coluna(destino, coluna, inicio, fim):
+    stats_coluna = _estatisticas_janela(inicio, fim).loc[coluna]
+    data_for_analysis = _DADOS["indice"].filtrar(inicio, fim)[["Data", coluna]].dropna()
+    partes = [_tabela({
+        "Métrica": ["N", "Média", "Mediana", "Moda"],
+        "Valor": [stats_coluna["n"], stats_coluna["media"], stats_coluna["mediana"], stats_coluna["moda"]],
+    })]
+    if data_for_analysis.empty:
+        partes.append("<p>Sem dados no período.</p>")
+        return partes
+
+    partes.append(_imagem(_salvar(grafico_linha(data_for_analysis, coluna), destino / "linha.png"), "Linha temporal"))
+    partes.append(_imagem(
+        _salvar(grafico_histograma(data_for_analysis[coluna], coluna), destino / "histograma.png"), "Histograma"))
+
+    if stats_coluna["n_regressao"] > 1 and not np.isnan(stats_coluna["coef"]):
+        x = eixo_anos(data_for_analysis)
+        y = data_for_analysis[coluna].to_numpy(dtype=float)
+        mask = ~np.isnan(x) & ~np.isnan(y)
+        coef, intercepto, r2 = stats_coluna["coef"], stats_coluna["intercepto"], stats_coluna["r2"]
+        fig = grafico_regressao(x[mask], y[mask], coef, intercepto, coluna)
+        partes.append(_imagem(_salvar(fig, destino / "regressao.png"), "Regressão linear"))
+        partes.append(f"<p><b>Equação da reta:</b> {html.escape(coluna)} = {coef:.2f} × Ano + {intercepto:.2f}<br>"
+                      f"<b>R²:</b> {r2:.4f}</p>")
+    return partes
+
+
+def _relatorio_categorias(destino, categorias, inicio, fim):
+    dados_plot = _DADOS["indice"].filtrar(inicio, fim)[list(categorias)].dropna()
+    if dados_plot.empty:
+        return ["<p>Sem dados no período.</p>"]
+    fig = grafico_boxplot_categorias(dados_plot)
+    return [_imagem(_salvar(fig, destino / "boxplot.png"), "Boxplot das categorias")]
+
+
+def _relatorio_comparacao(destino, par, inicio, fim):
+    indice = _DADOS["indice"]
+    coluna1, coluna2 = par
+    medias = indice.media_intervalo(inicio, fim, list(par))
+    fig = grafico_comparacao_temporal(indice.medias_por_periodo(inicio, fim, list(par)), coluna1, coluna2)
+    return [
+        _tabela({"Coluna": list(par), "Média no período": [medias[coluna1], medias[coluna2]]}),
+        _imagem(_salvar(fig, destino / "comparacao.png"), "Comparação temporal"),
+    ]
+
+
+def _relatorio_teste(destino, coluna, inicio, fim):
+    armazem = _DADOS["armazem"]
+    categoria = coluna.removeprefix("Valor_")
+    valores = armazem.valores("Brasil", categoria, inicio, fim)
+    dados_eua = armazem.valores("EUA", categoria, inicio, fim)
+    if len(valores) < 2 or len(dados_eua) < 2:
+        return ["<p>Dados insuficientes no período para o teste t.</p>"]
+
+    resumo = armazem.resumo_grupos(categoria, ["Brasil", "EUA"], inicio, fim)
+    t_stat, p_valor = stats.ttest_ind(valores, dados_eua, alternative="greater", equal_var=False)
+    # O pool já ocupa os processadores: a reamostragem roda em série dentro de cada tarefa
+    n_reamostras = reamostras_por_orcamento(len(valores) + len(dados_eua))
+    intervalo = bootstrap_diferenca(valores, dados_eua, n_reamostras=n_reamostras, semente=42, processos=1)
+    permutacao = teste_permutacao(valores, dados_eua, n_permutacoes=n_reamostras, alternativa="greater",
+                                  semente=42, processos=1)
+
+    df_box = pd.DataFrame({
+        "Valor": np.concatenate([valores, dados_eua]),
+        "Grupo": ["Brasil"] * len(valores) + ["EUA"] * len(dados_eua),
+    })
+    return [
+        _tabela(resumo),
+        _tabela({
+            "Teste": ["t (Welch, unilateral)", "Bootstrap 95% (Brasil − EUA)", "Permutação (unilateral)"],
+            "Estatística": [f"{t_stat:.4f}", f"{intervalo.estimativa:,.2f}", f"{permutacao.diferenca:,.2f}"],
+            "Resultado": [f"p = {p_valor:.4f}", f"[{intervalo.inferior:,.2f} ; {intervalo.superior:,.2f}]",
+                          f"p = {permutacao.p_valor:.4f}"],
+        }),
+        _imagem(_salvar(grafico_boxplot_grupos(df_box), destino / "boxplot.png"), "Boxplot Brasil x EUA"),
+        _imagem(_salvar(grafico_histograma_grupos(valores, dados_eua), destino / "histograma.png"),
+                "Histograma Brasil x EUA"),
+    ]
+
+
+_GERADORES = {
+    "coluna": _relatorio_coluna,
+    "categorias": _relatorio_categorias,
+    "comparacao": _relatorio_comparacao,
+    "teste": _relatorio_teste,
+}
+
+
+def _executar_tarefa(args):
+    saida, tarefa, versao = args
+    tipo, alvo, inicio, fim = tarefa
+    destino = _diretorio(saida, tarefa)
+    destino.mkdir(parents=True, exist_ok=True)
+    partes = _GERADORES[tipo](destino, alvo, inicio, fim)
+    titulo = f"{_nome(tarefa)} ({inicio}–{fim})"
+    (destino / "index.html").write_text(_pagina(titulo, partes), encoding="utf-8")
+    # A assinatura é gravada por último: uma tarefa interrompida é refeita na próxima execução
+    (destino / ".assinatura").write_text(_assinatura(versao, tarefa))
+    return tarefa
+
+
+def _escrever_indice(saida, tarefas, janelas):
+    linhas = []
+    for inicio, fim in janelas:
+        links = [
+            f"<a href=\"{inicio}-{fim}/{html.escape(_nome(t))}/index.html\">{html.escape(_nome(t))}</a>"
+            for t in tarefas if t[2:] == (inicio, fim)
+        ]
+        linhas.append(f"<h2>{inicio}–{fim}</h2>\n<p>{' · '.join(links)}</p>")
+    (Path(saida) / "index.html").write_text(_pagina("Relatório de Exportações", linhas), encoding="utf-8")
+
+
+def gerar_relatorio(arquivo=ARQUIVO_DADOS, saida=DIRETORIO_SAIDA, janela=10, passo=5, processos=None, forcar=False):
+    """Gera a matriz completa do relatório e devolve (tarefas geradas, tarefas puladas)."""
+    # Preparação única no processo principal: cópia Parquet e sincronização do armazém
+    df = ler_dados(arquivo)
+    _, mtime_ns, tamanho = versao_dados(arquivo)
+    armazem = _armazem_relatorio(arquivo)
+    armazem.sincronizar_dataframe(df, pais="Brasil", origem=Path(arquivo).name, versao=f"{mtime_ns}-{tamanho}")
+    assinatura_armazem = armazem.assinatura()
+
+    janelas = janelas_anos(df["Data"].dropna(), janela, passo) if "Data" in df.columns else []
+    tarefas = montar_tarefas(df, armazem, janelas)
+    versoes = {t: _versao_tarefa(t, (mtime_ns, tamanho), assinatura_armazem) for t in tarefas}
+    pendentes = [(saida, t, versoes[t]) for t in tarefas if forcar or not _atualizado(saida, t, versoes[t])]
+
+    processos = processos or os.cpu_count() or 1
+    if processos > 1 and len(pendentes) > 1:
+        with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar,
+                                 initargs=(arquivo, armazem.caminho)) as pool:
+            lote = max(1, len(pendentes) // (processos * 4))
+            list(pool.map(_executar_tarefa, pendentes, chunksize=lote))
+    elif pendentes:
+        _iniciar(arquivo, armazem.caminho)
+        for args in pendentes:
+            _executar_tarefa(args)
+
+    Path(saida).mkdir(parents=True, exist_ok=True)
+    _escrever_indice(saida, tarefas, janelas)
+    return len(pendentes), len(tarefas) - len(pendentes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relatório estático (HTML + PNG) de todas as colunas e períodos.")
+    parser.add_argument("--arquivo", default=ARQUIVO_DADOS, help="planilha ou Parquet de origem")
+    parser.add_argument("--saida", default=DIRETORIO_SAIDA, help="diretório dos relatórios")
+    parser.add_argument("--janela", type=int, default=10, help="tamanho das janelas, em anos")
+    parser.add_argument("--passo", type=int, default=5, help="avanço entre janelas, em anos")
+    parser.add_argument("--processos", type=int, help="processos do pool (padrão: todos os núcleos)")
+    parser.add_argument("--forcar", action="store_true", help="refaz também os artefatos atualizados")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    geradas, puladas = gerar_relatorio(args.arquivo, args.saida, args.janela, args.passo, args.processos, args.forcar)
+    print(f"{geradas} tarefas geradas, {puladas} já atualizadas, em {time.perf_counter() - inicio:.1f} s "
+          f"-> {Path(args.saida) / 'index.html'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+
+def eixo_anos(df):
+    """Converte a coluna 'Data' para anos numéricos (float, NaN quando não convertível)."""
+    if "Data" not in df.columns:
+        return None
+    if np.issubdtype(df["Data"].dtype, np.datetime64):
+        return df["Data"].dt.year.to_numpy(dtype=float)
+    return pd.to_numeric(df["Data"], errors="coerce").to_numpy(dtype=float)
+
+
+def _somas_centradas(x, Y):
+    # Máscara conjunta (x e y válidos) e ano centralizado, para reduzir cancelamento numérico
+    validos = ~np.isnan(Y) & ~np.isnan(x)[:, None]
+    x0 = np.nanmean(x) if np.any(~np.isnan(x)) else 0.0
+    X = np.where(validos, (x - x0)[:, None], 0.0)
+    Yz = np.where(validos, Y, 0.0)
+    return validos, x0, X, Yz
+
+
+def _resolver(n, sx, sy, sxx, sxy, syy, x0):
+    # Equações normais da reta y = a + b·x resolvidas para todas as colunas de uma vez
+    with np.errstate(invalid="ignore", divide="ignore"):
+        vxx = sxx - sx ** 2 / n
+        vxy = sxy - sx * sy / n
+        vyy = syy - sy ** 2 / n
+        ajustavel = (n > 1) & (vxx > 0)
+        coef = np.where(ajustavel, vxy / vxx, np.nan)
+        intercepto = np.where(ajustavel, (sy - coef * sx) / n - coef * x0, np.nan)
+        r2 = np.where(ajustavel & (vyy > 0), 1 - (vyy - coef * vxy) / vyy, np.nan)
+    return coef, intercepto, r2
+
+
+def ajustar_tendencias(x, Y):
+    """Ajusta a regressão linear de cada coluna de Y contra x numa única solução vetorizada.
+
+    As colunas podem ter valores ausentes em linhas diferentes: cada uma usa apenas os
+    seus pontos válidos. Retorna arrays (n, coef, intercepto, r2), um valor por coluna.
+    """
+    x = np.asarray(x, dtype=float)
+    Y = np.asarray(Y, dtype=float).reshape(len(x), -1)
+    validos, x0, X, Yz = _somas_centradas(x, Y)
+    n = validos.sum(axis=0)
+    coef, intercepto, r2 = _resolver(
+        n, X.sum(axis=0), Yz.sum(axis=0), (X * X).sum(axis=0), (X * Yz).sum(axis=0), (Yz * Yz).sum(axis=0), x0
+    )
+    return n, coef, intercepto, r2
+
+
+def tendencias_moveis(x, Y, colunas, janela=None):
+    """Inclinação de cada coluna em janelas móveis de `janela` anos (ou expansivas, se None).
+
+    Usa somas acumuladas de x, y, x², xy e y²: cada janela é a diferença entre duas
+    posições, então o custo é linear no número de linhas, sem um polyfit por janela.
+    O resultado é indexado pelo último ano de cada janela.
+    """
+    x = np.asarray(x, dtype=float)
+    ordem = np.argsort(x, kind="stable")
+    x = x[ordem]
+    Y = np.asarray(Y, dtype=float).reshape(len(ordem), -1)[ordem]
+    validos, x0, X, Yz = _somas_centradas(x, Y)
+
+    def acumulado(valores):
+        return np.vstack([np.zeros((1, valores.shape[1])), np.cumsum(valores, axis=0)])
+
+    somas = [acumulado(v) for v in (validos.astype(float), X, Yz, X * X, X * Yz, Yz * Yz)]
+
+    # Um ajuste por ano distinto, terminando na última linha daquele ano
+    anos = np.unique(x[~np.isnan(x)])
+    fim = np.searchsorted(x, anos, side="right")
+    if janela is None:
+        inicio = np.zeros_like(fim)
+    else:
+        inicio = np.searchsorted(x, anos - janela + 1, side="left")
+
+    diferencas = [s[fim] - s[inicio] for s in somas]
+    coef, _, _ = _resolver(*diferencas, x0)
+    return pd.DataFrame(coef, index=pd.Index(anos.astype(int), name="Ano"), columns=list(colunas))
+
+
+def ranking_crescimento(df, colunas, janela=10):
+    """Tabela "quais categorias mais crescem", ordenada pelo crescimento relativo anual.
+
+    Traz a inclinação no período todo (em unidades por ano e em % da média), o R² e a
+    inclinação na janela mais recente de `janela` anos.
+    """
+    x = eixo_anos(df)
+    Y = df[colunas].to_numpy(dtype=float)
+    n, coef, _, r2 = ajustar_tendencias(x, Y)
+    media = np.nanmean(Y, axis=0) if len(Y) else np.full(len(colunas), np.nan)
+    recente = tendencias_moveis(x, Y, colunas, janela=janela)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        crescimento = coef / np.abs(media) * 100
+    tabela = pd.DataFrame(
+        {
+            "Crescimento anual (% da média)": crescimento,
+            "Inclinação (por ano)": coef,
+            f"Inclinação últimos {janela} anos": recente.iloc[-1].to_numpy() if len(recente) else np.nan,
+            "R²": r2,
+            "N": n,
+        },
+        index=pd.Index(colunas, name="Coluna"),
+    )
+    return tabela.sort_values("Crescimento anual (% da média)", ascending=False)